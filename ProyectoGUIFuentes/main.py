@@ -1,174 +1,564 @@
 import sys
 import subprocess
+import selectors
 import re
-from typing import List
+from typing import NamedTuple
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy,
-    QLabel, QPushButton, QFrame, QGraphicsDropShadowEffect, QTextEdit,
+    QLabel, QPushButton, QFrame, QTextEdit,
     QFileDialog, QMessageBox
 )
-from PyQt6.QtGui import QColor, QIcon, QFont
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QIcon, QFont, QTextCursor
+from PyQt6.QtCore import Qt, QRunnable, QThreadPool, QTimer, pyqtSignal
 import os
 import glob
 import platform
+import functools
+import time
+import queue
+import threading
+import contextlib
+import io
+from collections import deque
+import shutil
+from pathlib import Path
+import numpy as np
 import PyQt6.QtCore as QtCore
 from PyQt6.QtCore import QObject
 
 # Importar utilities
-from utilities.parser import parse_minizinc_output, parse_dzn_input
+from utilities.parser import parse_minizinc_output, parse_dzn_input, POL_NO_ENCONTRADA
 from utilities.checker import verificar_solucion
+from utilities.converter import convertir_txt_a_dzn, convertir_lote, en_directorio
+
+# Ruta de `stdbuf` (coreutils) para forzar salida por líneas en POSIX; None si no existe
+_STDBUF = shutil.which("stdbuf") if os.name != 'nt' else None
+
+# Líneas de salida del solver que se conservan para el parseo final. Si la salida
+# las supera y lo conservado empieza a mitad de una solución, antes de parsear se
+# descarta esa solución incompleta (ver _salida_para_parseo)
+_MAX_LINEAS_SALIDA = 5000
+
+# Separador que MiniZinc imprime al final de cada solución
+_SEPARADOR_SOLUCION = "----------"
+
+
+def _abre_solucion(linea):
+    """True si `linea` (ya sin espacios) es el encabezado de una sección de la solución."""
+    return linea[:40].lower().startswith(("polarizacion", "distribucion final", "=== matriz"))
+
+# Texto (en minúsculas) con el que MiniZinc informa que no pudo cargar la DLL de
+# Gurobi; se busca en toda la línea (puede venir precedido de una ruta o un prefijo)
+_GUROBI_DLL_ERROR = "cannot load gurobi dll"
+
+# Aviso de MiniZinc cuando un archivo local tiene el mismo nombre que uno de su biblioteca
+_LIB_MARKER = "included from library"
+
+# Bloques (líneas) que conserva el panel de resultados; los más antiguos se descartan.
+# El panel es solo visual: el parseo usa la salida que entrega el worker (last_output)
+_MAX_BLOQUES_PANEL = 5000
+
+# La salida visible se envía a la GUI en lotes de hasta ~8 KB o cada 50 ms, lo que
+# ocurra primero, para no saturar el hilo principal con señales encoladas
+_LOTE_SALIDA_BYTES = 8192
+_LOTE_SALIDA_SEGUNDOS = 0.05
+
+# Hilos del pool de la ventana (ver MinPolGUI.__init__)
+_MAX_HILOS_POOL = 3
+
+# Lotes enviados que la GUI aún no consumió. Si se alcanza este número el worker
+# deja de emitir y sigue acumulando hasta que la GUI se ponga al día
+_MAX_LOTES_EN_VUELO = 4
+
+# Argumentos extra de Popen: en Windows se lanza MiniZinc sin cmd.exe intermedio ni
+# ventana de consola
+_POPEN_KW = {}
+if os.name == 'nt':
+    _POPEN_KW['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+# ==================== SOLVERS ====================
+# Los solvers instalados no cambian durante una sesión de la GUI: las consultas a
+# `minizinc` se hacen una sola vez y se reutilizan en cada ejecución del modelo.
+
+@functools.lru_cache(maxsize=1)
+def _minizinc_path():
+    """Ruta absoluta de `minizinc` (búsqueda en PATH una sola vez); "minizinc" si no se encuentra."""
+    return shutil.which("minizinc") or "minizinc"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_solvers_stdout():
+    """Salida (en minúsculas) de `minizinc --solvers`; cadena vacía si falla."""
+    try:
+        result = subprocess.run(
+            [_minizinc_path(), "--solvers"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.stdout.lower()
+    except Exception:
+        return ""
+
+
+@functools.lru_cache(maxsize=8)
+def _check_solver_available(solver_name):
+    # No se prueba la carga de la DLL de Gurobi aquí: si falla, la propia ejecución
+    # lo detecta ("cannot load gurobi dll") y se pasa a Gecode
+    # Gurobi es un backend integrado en MiniZinc (sin archivo .msc): solo aparece
+    # en `minizinc --solvers`, cuya salida se consulta una vez por sesión
+    try:
+        return solver_name.lower() in _get_solvers_stdout()
+    except Exception:
+        return False
+
+def _validar_rutas(model_path, dzn_path):
+    """
+    Comprueba una sola vez que el modelo y los datos existen y devuelve sus rutas
+    absolutas como Path. Lanza FileNotFoundError con un mensaje para el usuario.
+    """
+    if not dzn_path or not os.path.isfile(dzn_path):
+        raise FileNotFoundError("No hay archivo DZN válido.")
+    if not os.path.isfile(model_path):
+        raise FileNotFoundError("No se encontró Proyecto.mzn")
+    return Path(os.path.abspath(model_path)), Path(os.path.abspath(dzn_path))
+
+# Nombres de la biblioteca de Gurobi por plataforma (equivalentes a gurobi*.dll,
+# libgurobi*.so y libgurobi*.dylib); Windows no distingue mayúsculas
+_GUROBI_DLL_RE = re.compile(r'gurobi.*\.dll\Z', re.IGNORECASE)
+_GUROBI_SO_RE = re.compile(r'libgurobi.*\.so\Z')
+_GUROBI_DYLIB_RE = re.compile(r'libgurobi.*\.dylib\Z')
+
+
+def _dirs_entorno(*variables):
+    """Directorios listados en las variables de entorno dadas, en orden y sin vacíos ni repetidos."""
+    return tuple(dict.fromkeys(
+        d for variable in variables for d in os.environ.get(variable, '').split(os.pathsep) if d
+    ))
+
+
+# Tablas por sistema para la búsqueda de Gurobi, calculadas una vez al importar
+_PATH_DIRS = _dirs_entorno('PATH')
+
+_LIB_DIRS_BY_SYSTEM = {
+    "Windows": _PATH_DIRS,
+    "Linux": _dirs_entorno('PATH', 'LD_LIBRARY_PATH'),
+    "Darwin": _PATH_DIRS,
+}
+
+_GUROBI_LIB_RE_BY_SYSTEM = {
+    "Windows": _GUROBI_DLL_RE,
+    "Linux": _GUROBI_SO_RE,
+    "Darwin": _GUROBI_DYLIB_RE,
+}
+
+# Directorios de instalación habituales (patrones glob); la biblioteca dentro de
+# ellos se reconoce con el regex del sistema
+_COMMON_DIRS_BY_SYSTEM = {
+    "Windows": [
+        r"C:\gurobi*\win64\bin",
+        r"C:\Program Files\gurobi*\win64\bin",
+    ],
+    "Linux": [
+        "/opt/gurobi*/linux64/lib",
+        "/usr/local/gurobi*/linux64/lib",
+    ],
+    "Darwin": [
+        "/Library/gurobi*/macos_universal2/lib",
+    ],
+}
+
+# Si existe GUROBI_HOME, buscar ahí también (al final)
+if os.environ.get('GUROBI_HOME'):
+    _gurobi_home = os.environ['GUROBI_HOME']
+    _COMMON_DIRS_BY_SYSTEM["Windows"].append(os.path.join(_gurobi_home, 'bin'))
+    _COMMON_DIRS_BY_SYSTEM["Linux"].append(os.path.join(_gurobi_home, 'lib'))
+    _COMMON_DIRS_BY_SYSTEM["Darwin"].append(os.path.join(_gurobi_home, 'lib'))
+
+
+def _gurobi_search_iter(sistema):
+    """
+    Pares (directorio, patrón) donde buscar la biblioteca de Gurobi, en orden de
+    prioridad: primero el entorno y luego las ubicaciones habituales. Se generan a
+    demanda, así que los globs de las ubicaciones habituales solo se evalúan si
+    no hubo coincidencia antes.
+    """
+    patron_re = _GUROBI_LIB_RE_BY_SYSTEM[sistema]
+    for directorio in _LIB_DIRS_BY_SYSTEM[sistema]:
+        yield directorio, patron_re
+    for patron_dir in _COMMON_DIRS_BY_SYSTEM[sistema]:
+        for directorio in glob.iglob(patron_dir):
+            yield directorio, patron_re
+
+
+def _primer_archivo(directorio, patron_re):
+    """Primer archivo de `directorio` cuyo nombre coincide con `patron_re` (una sola pasada con os.scandir)."""
+    try:
+        with os.scandir(directorio) as entradas:
+            for entrada in entradas:
+                if patron_re.match(entrada.name) and entrada.is_file():
+                    return entrada.path
+    except OSError:
+        pass
+    return None
 
 # ==================== WORKER ====================
-class MinizincWorker(QObject):
-    outputReady = pyqtSignal(str)
-    finished = pyqtSignal(str, bool)
+class MinizincSignals(QObject):
+    """Señales de MinizincRunnable (QRunnable no hereda de QObject y no puede emitirlas)."""
+    # Sobrecarga por defecto: lote de líneas de salida del solver (list[str]), sin
+    # unirlas en el hilo de trabajo. outputReady[str] lleva mensajes de estado ya formateados.
+    outputReady = pyqtSignal([list], [str])
+    # (salida, éxito, polarización, distribución final, matrices x); los tres
+    # últimos son None si la ejecución falló o no se pudo parsear la salida
+    finished = pyqtSignal(str, bool, object, object, object)
     errorOccurred = pyqtSignal(str)
 
-    def __init__(self, model_path, dzn_path):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Contrapresión hacia la GUI: el worker toma un permiso por cada lote que
+        # emite por outputReady[list] y la GUI lo devuelve con lote_consumido()
+        self.lotes_libres = threading.BoundedSemaphore(_MAX_LOTES_EN_VUELO)
+
+    def lote_consumido(self):
+        """La GUI llama a este método al recibir cada lote de outputReady[list]."""
+        self.lotes_libres.release()
+
+
+class MinizincRunnable(QRunnable):
+    # Resultado de la búsqueda de la DLL de Gurobi por sistema operativo (None si no
+    # se encontró); se comparte entre ejecuciones para no repetir los globs
+    _gurobi_dll_cache = {}
+
+    @classmethod
+    def invalidate_caches(cls):
+        """Olvida la DLL de Gurobi y los solvers detectados (p. ej. si se instaló Gurobi durante la sesión)."""
+        cls._gurobi_dll_cache.clear()
+        _minizinc_path.cache_clear()
+        _get_solvers_stdout.cache_clear()
+        _check_solver_available.cache_clear()
+
+    def __init__(self, model_path, dzn_path, signals=None):
         super().__init__()
-        self.model_path = model_path
-        self.dzn_path = dzn_path
+        # La GUI pasa un MinizincSignals ya conectado, uno nuevo por ejecución
+        self.signals = signals if signals is not None else MinizincSignals()
+        # Rutas ya validadas por _validar_rutas en la GUI
+        self.model_path = os.fspath(model_path)
+        self.dzn_path = os.fspath(dzn_path)
+        # Partes de las rutas que se usan en cada comando y en cada línea de salida
+        self._model_basename = os.path.basename(self.model_path)
+        self._model_dirname = os.path.dirname(self.model_path)
         self._is_interrupted = False
         self.process = None
-        self._last_output_lines = []
+        self._last_output_lines = deque(maxlen=_MAX_LINEAS_SALIDA)
+        # Por cada línea conservada, si forma parte de una solución (desde un
+        # encabezado hasta el separador), y si la última línea que descartó la deque
+        # era de una solución que sigue dentro de lo conservado
+        self._lineas_en_solucion = deque(maxlen=_MAX_LINEAS_SALIDA)
+        self._recorte_a_mitad_de_solucion = False
+        
+        # Pipe de interrupción: interrupt() escribe un byte y el selector del lector
+        # despierta de inmediato, aunque el solver lleve tiempo sin imprimir nada
+        self._intr_r = self._intr_w = None
+        # interrupt() escribe desde el hilo de la GUI y run() cierra el pipe en el hilo
+        # del pool: sin el lock, un descriptor ya cerrado (y reutilizado por otro
+        # archivo) podría recibir el byte de interrupción
+        self._intr_lock = threading.Lock()
+        if os.name != 'nt':
+            self._intr_r, self._intr_w = os.pipe()
+            os.set_blocking(self._intr_r, False)
+            os.set_blocking(self._intr_w, False)
 
     def interrupt(self):
         self._is_interrupted = True
+        with self._intr_lock:
+            if self._intr_w is not None:
+                try:
+                    os.write(self._intr_w, b'x')
+                except OSError:
+                    pass
         if self.process and self.process.poll() is None:
+            self._enviar_terminacion()
+
+    def _enviar_terminacion(self):
+        # terminate() en todos los sistemas (TerminateProcess en Windows). No se usa
+        # CTRL_BREAK_EVENT: solo llega a procesos de la consola del llamador, y el
+        # solver se lanza sin consola (bajo pythonw la GUI tampoco tiene una)
+        try:
             self.process.terminate()
+        except OSError:
+            pass  # El proceso ya terminó; _terminar_proceso sigue con wait/kill
+
+    def _terminar_proceso(self):
+        """Termina el proceso del solver; si no responde en 500 ms, lo mata."""
+        if self.process is None or self.process.poll() is not None:
+            return
+        self._enviar_terminacion()
+        try:
+            self.process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    def _salida_para_parseo(self):
+        """
+        Salida conservada, lista para parse_minizinc_output. Si la deque cortó una
+        solución, sus últimas líneas siguen al inicio de lo conservado y el parser
+        (que toma la primera aparición de cada sección) la mezclaría con la
+        siguiente: en ese caso se empieza después del primer separador.
+        """
+        lineas = self._last_output_lines
+        if self._recorte_a_mitad_de_solucion:
+            lineas = list(lineas)
+            try:
+                lineas = lineas[lineas.index(_SEPARADOR_SOLUCION) + 1:]
+            except ValueError:
+                lineas = []  # Todo lo conservado es parte de una solución cortada
+        return "\n".join(lineas)
+
+    def _cerrar_pipe_interrupcion(self):
+        with self._intr_lock:
+            for fd in (self._intr_r, self._intr_w):
+                if fd is not None:
+                    os.close(fd)
+            self._intr_r = self._intr_w = None
 
     def _find_gurobi_dll(self):
+        """Ruta de la DLL de Gurobi, buscada una sola vez por sesión (ver _buscar_gurobi_dll)."""
+        sistema = platform.system()
+        if sistema not in self._gurobi_dll_cache:
+            self._gurobi_dll_cache[sistema] = self._buscar_gurobi_dll()
+        return self._gurobi_dll_cache[sistema]
+
+    def _buscar_gurobi_dll(self):
         """Busca automáticamente la DLL de Gurobi en PATH y ubicaciones comunes"""
-        # Primero: Buscar en el PATH del sistema
-        path_dirs = os.environ.get('PATH', '').split(os.pathsep)
+        sistema = platform.system()
+        if sistema not in _GUROBI_LIB_RE_BY_SYSTEM:
+            return None
         
-        if platform.system() == "Windows":
-            dll_pattern = "gurobi*.dll"
-            
-            # Buscar en cada directorio del PATH
-            for path_dir in path_dirs:
-                if os.path.exists(path_dir):
-                    dll_files = glob.glob(os.path.join(path_dir, dll_pattern))
-                    if dll_files:
-                        return dll_files[0]
-            
-            # Si no se encontró en PATH, buscar en ubicaciones comunes
-            search_paths = [
-                r"C:\gurobi*\win64\bin\gurobi*.dll",
-                r"C:\Program Files\gurobi*\win64\bin\gurobi*.dll",
-            ]
-            
-            # Si existe GUROBI_HOME, buscar ahí también
-            gurobi_home = os.environ.get('GUROBI_HOME')
-            if gurobi_home:
-                search_paths.append(os.path.join(gurobi_home, 'bin', 'gurobi*.dll'))
-            
-            for pattern in search_paths:
-                matches = glob.glob(pattern)
-                if matches:
-                    return matches[0]
+        # Cada directorio se lista una sola vez aunque aparezca repetido; se
+        # detiene en la primera coincidencia
+        vistos = set()
+        for directorio, patron_re in _gurobi_search_iter(sistema):
+            if directorio in vistos:
+                continue
+            vistos.add(directorio)
+            lib = _primer_archivo(directorio, patron_re)
+            if lib:
+                return lib
         
-        elif platform.system() == "Linux":
-            so_pattern = "libgurobi*.so"
-            
-            # Buscar en PATH
-            for path_dir in path_dirs:
-                if os.path.exists(path_dir):
-                    so_files = glob.glob(os.path.join(path_dir, so_pattern))
-                    if so_files:
-                        return so_files[0]
-            
-            # Buscar en LD_LIBRARY_PATH
-            ld_path_dirs = os.environ.get('LD_LIBRARY_PATH', '').split(os.pathsep)
-            for ld_dir in ld_path_dirs:
-                if os.path.exists(ld_dir):
-                    so_files = glob.glob(os.path.join(ld_dir, so_pattern))
-                    if so_files:
-                        return so_files[0]
-            
-            search_paths = [
-                "/opt/gurobi*/linux64/lib/libgurobi*.so",
-                "/usr/local/gurobi*/linux64/lib/libgurobi*.so",
-            ]
-            
-            gurobi_home = os.environ.get('GUROBI_HOME')
-            if gurobi_home:
-                search_paths.append(os.path.join(gurobi_home, 'lib', 'libgurobi*.so'))
-            
-            for pattern in search_paths:
-                matches = glob.glob(pattern)
-                if matches:
-                    return matches[0]
+        return None
+
+    def _leer_bloques(self):
+        """
+        Genera la salida del proceso como listas de líneas, una lista por lectura
+        (una lista vacía en cada ciclo sin datos, para que quien consume pueda
+        vaciar sus lotes por tiempo).
         
-        elif platform.system() == "Darwin":  # macOS
-            dylib_pattern = "libgurobi*.dylib"
-            
-            for path_dir in path_dirs:
-                if os.path.exists(path_dir):
-                    dylib_files = glob.glob(os.path.join(path_dir, dylib_pattern))
-                    if dylib_files:
-                        return dylib_files[0]
-            
-            search_paths = [
-                "/Library/gurobi*/macos_universal2/lib/libgurobi*.dylib",
-            ]
-            
-            gurobi_home = os.environ.get('GUROBI_HOME')
-            if gurobi_home:
-                search_paths.append(os.path.join(gurobi_home, 'lib', 'libgurobi*.dylib'))
+        La salida se lee en bloques grandes de bytes y las líneas se separan en
+        Python, en lugar de hacer una llamada al sistema por línea.
+        """
+        if os.name == 'nt':
+            chunks = self._leer_chunks_hilo()
+        else:
+            chunks = self._leer_chunks_selector()
+        
+        buffer = bytearray()
+        for chunk in chunks:
+            if not chunk:
+                yield []
+                continue
             
-            for pattern in search_paths:
-                matches = glob.glob(pattern)
-                if matches:
-                    return matches[0]
+            buffer += chunk
+            *lines, resto = buffer.split(b'\n')
+            buffer = bytearray(resto)
+            if lines:
+                yield [raw_line.decode('utf-8', 'replace') for raw_line in lines]
         
-        return None
+        # Última línea sin salto de línea final
+        if buffer and not self._is_interrupted:
+            yield [buffer.decode('utf-8', 'replace')]
+
+    def _leer_chunks_selector(self):
+        """
+        Bloques de bytes de stdout en POSIX; b'' en cada ciclo sin datos.
+        
+        Se espera con `selectors` y se lee con `os.read`. El pipe de interrupción
+        está registrado en el mismo selector, de modo que Detener responde de
+        inmediato aunque el solver no imprima nada.
+        """
+        fd = self.process.stdout.fileno()
+        
+        # En Linux (5.3+) un pidfd se vuelve legible cuando el proceso termina: el
+        # selector despierta justo en ese momento aunque algún subproceso del solver
+        # mantenga el pipe abierto. En otros sistemas basta con esperar el EOF.
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self.process.pid)
+            except OSError:
+                pidfd = None
+        
+        proceso_terminado = False
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                if pidfd is not None:
+                    selector.register(pidfd, selectors.EVENT_READ)
+                if self._intr_r is not None:
+                    selector.register(self._intr_r, selectors.EVENT_READ)
+                
+                while not self._is_interrupted:
+                    eventos = selector.select(timeout=0.1)
+                    listos = {key.fd for key, _ in eventos}
+                    
+                    if self._intr_r in listos:
+                        self._terminar_proceso()
+                        return
+                    
+                    if pidfd in listos:
+                        # Terminó el proceso: drenar lo que quede en el pipe sin bloquear
+                        proceso_terminado = True
+                        selector.unregister(pidfd)
+                        os.set_blocking(fd, False)
+                    
+                    if fd not in listos:
+                        if proceso_terminado:
+                            break
+                        yield b''
+                        continue
+                    
+                    try:
+                        chunk = os.read(fd, 65536)
+                    except BlockingIOError:
+                        break
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+
+    def _leer_chunks_hilo(self):
+        """
+        Bloques de bytes de stdout en Windows; b'' en cada ciclo sin datos.
+        
+        select() no admite pipes en Windows: un hilo auxiliar hace las lecturas
+        bloqueantes y pasa los bloques por una cola, que aquí se consulta cada
+        100 ms para revisar la bandera de interrupción.
+        """
+        stdout = self.process.stdout
+        cola = queue.Queue()
+        
+        def lector():
+            try:
+                while True:
+                    # read1 devuelve lo que haya disponible (hasta 64 KB) sin esperar a llenar el bloque
+                    chunk = stdout.read1(65536)
+                    if not chunk:
+                        break
+                    cola.put(chunk)
+            except (OSError, ValueError):
+                pass
+            finally:
+                cola.put(None)
+        
+        threading.Thread(target=lector, daemon=True).start()
+        
+        while not self._is_interrupted:
+            try:
+                chunk = cola.get(timeout=0.1)
+            except queue.Empty:
+                yield b''
+                continue
+            if chunk is None:
+                break
+            yield chunk
 
     def _run_minizinc_command(self, command, suppress_dll_errors=False, cwd=None):
         try:
+            # MiniZinc y el solver usan búfer por bloques cuando escriben a un pipe;
+            # con stdbuf (si existe) se fuerza búfer por líneas y la salida llega en vivo
+            if _STDBUF:
+                command = [_STDBUF, "-oL", "-eL"] + list(command)
+            
             self.process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,
-                shell=True if os.name == 'nt' else False,
-                cwd=cwd
+                bufsize=-1,
+                cwd=cwd,
+                **_POPEN_KW
             )
 
             dll_error_detected = False
+            # Mientras la GUI va atrasada los lotes se siguen acumulando aquí; el panel
+            # solo conserva las últimas _MAX_BLOQUES_PANEL líneas, así que descartar
+            # las más antiguas no cambia lo que termina mostrándose
+            visibles = deque(maxlen=_MAX_BLOQUES_PANEL)
+            visibles_bytes = 0
+            ultimo_envio = time.monotonic()
+            model_basename = self._model_basename
+            ultimas = self._last_output_lines
+            en_solucion_por_linea = self._lineas_en_solucion
+            en_solucion = False
+            recorte_a_mitad = self._recorte_a_mitad_de_solucion
             
-            while True:
-                line = self.process.stdout.readline()
-                if not line and self.process.poll() is None:
-                    break
-                if line:
+            for bloque in self._leer_bloques():
+                for line in bloque:
                     stripped = line.strip()
 
                     # Filtrar avisos de conflicto de nombre cuando el archivo local
                     # `Proyecto.mzn` existe intencionalmente en el directorio de trabajo
-                    try:
-                        if 'included from library' in stripped and os.path.basename(self.model_path) in stripped:
-                            continue
-                    except Exception:
-                        pass
+                    if _LIB_MARKER in stripped and model_basename in stripped:
+                        continue
                     
-                    # Detectar error de DLL de Gurobi
-                    if "cannot load gurobi dll" in stripped.lower():
+                    # Detectar error de DLL de Gurobi (una vez detectado no se vuelve a buscar)
+                    if not dll_error_detected and _GUROBI_DLL_ERROR in stripped.lower():
                         dll_error_detected = True
                         if suppress_dll_errors:
                             continue  # No mostrar este mensaje ni guardarlo
                     
-                    self._last_output_lines.append(stripped)
+                    if en_solucion:
+                        en_solucion = stripped != _SEPARADOR_SOLUCION
+                    else:
+                        en_solucion = _abre_solucion(stripped)
+                    if len(ultimas) == _MAX_LINEAS_SALIDA:
+                        # La línea más antigua sale de la deque: lo conservado queda a
+                        # mitad de una solución si esa línea era parte de una
+                        recorte_a_mitad = en_solucion_por_linea[0]
+                    ultimas.append(stripped)
+                    en_solucion_por_linea.append(en_solucion)
                     
                     # Si suppress_dll_errors está activo y hay error de DLL, no mostrar nada
                     if not (suppress_dll_errors and dll_error_detected):
-                        self.outputReady.emit(stripped + "\n")
-                        
-                if self._is_interrupted:
-                    self.process.terminate()
-                    break
+                        visibles.append(stripped)
+                        visibles_bytes += len(stripped) + 1
+                
+                # Una sola señal por lote, acumulando entre lecturas hasta llenar el
+                # lote o cumplir el intervalo, y solo si la GUI no tiene demasiados
+                # lotes sin procesar
+                ahora = time.monotonic()
+                if (visibles and (visibles_bytes >= _LOTE_SALIDA_BYTES
+                                  or ahora - ultimo_envio >= _LOTE_SALIDA_SEGUNDOS)
+                        and self.signals.lotes_libres.acquire(blocking=False)):
+                    self.signals.outputReady.emit(list(visibles))
+                    visibles.clear()
+                    visibles_bytes = 0
+                    ultimo_envio = ahora
+
+            self._recorte_a_mitad_de_solucion = recorte_a_mitad
+
+            # Lo que quede pendiente (fin de la salida o interrupción) se envía siempre.
+            # Sin permiso libre va como texto por outputReady[str], que no devuelve
+            # permiso, para que la cuenta de lotes en vuelo siga siendo exacta
+            if visibles:
+                if self.signals.lotes_libres.acquire(blocking=False):
+                    self.signals.outputReady.emit(list(visibles))
+                else:
+                    self.signals.outputReady[str].emit("\n".join(visibles) + "\n")
+
+            if self._is_interrupted:
+                self._terminar_proceso()
 
             self.process.wait()
             
@@ -179,100 +569,108 @@ class MinizincWorker(QObject):
             return self.process.returncode == 0
 
         except Exception as e:
-            self.errorOccurred.emit(f"Excepción al ejecutar MiniZinc: {str(e)}")
+            self.signals.errorOccurred.emit(f"Excepción al ejecutar MiniZinc: {str(e)}")
             return False
 
     def run(self):
         success = False
         try:
-            if not os.path.exists(self.model_path):
-                self.errorOccurred.emit(f"Archivo modelo no encontrado: {self.model_path}")
-                return
-
-            if not os.path.exists(self.dzn_path):
-                self.errorOccurred.emit(f"Archivo de datos no encontrado: {self.dzn_path}")
-                return
-
-            gurobi_available = self._check_solver_available("gurobi")
+            gurobi_available = _check_solver_available("gurobi")
             
             if gurobi_available:
-                self.outputReady.emit("🔍 Intentando con solver Gurobi...\n")
+                self.signals.outputReady[str].emit("🔍 Intentando con solver Gurobi...\n")
                 
                 # Buscar automáticamente la DLL de Gurobi
                 gurobi_dll = self._find_gurobi_dll()
                 
                 if gurobi_dll:
-                    self.outputReady.emit(f"   ✓ DLL encontrada: {os.path.basename(gurobi_dll)}\n")
+                    self.signals.outputReady[str].emit(f"   ✓ DLL encontrada: {os.path.basename(gurobi_dll)}\n")
                     command = [
-                        "minizinc", "-I", os.path.dirname(self.model_path), "--solver", "gurobi", 
+                        _minizinc_path(), "-I", self._model_dirname, "--solver", "gurobi", 
                         "--gurobi-dll", gurobi_dll,
                         self.model_path, self.dzn_path
                     ]
                 else:
-                    self.outputReady.emit("   Intentando sin especificar DLL...\n")
+                    self.signals.outputReady[str].emit("   Intentando sin especificar DLL...\n")
                     command = [
-                        "minizinc", "-I", os.path.dirname(self.model_path), "--solver", "gurobi",
+                        _minizinc_path(), "-I", self._model_dirname, "--solver", "gurobi",
                         self.model_path, self.dzn_path
                     ]
                 
-                success = self._run_minizinc_command(command, suppress_dll_errors=True, cwd=os.path.dirname(self.model_path))
+                success = self._run_minizinc_command(command, suppress_dll_errors=True, cwd=self._model_dirname)
                 
                 # Si Gurobi falló, cambiar a Gecode
                 if not success and not self._is_interrupted:
-                    self.outputReady.emit("\n⚠️ Gurobi no disponible, usando Gecode...\n\n")
+                    self.signals.outputReady[str].emit("\n⚠️ Gurobi no disponible, usando Gecode...\n\n")
                     # Limpiar las líneas de salida de Gurobi
-                    self._last_output_lines = []
+                    self._last_output_lines.clear()
+                    self._lineas_en_solucion.clear()
+                    self._recorte_a_mitad_de_solucion = False
 
             # Si Gurobi no estaba disponible o falló, usar Gecode
             if not success and not self._is_interrupted:
                 if not gurobi_available:
-                    self.outputReady.emit("🔍 Usando solver Gecode...\n")
+                    self.signals.outputReady[str].emit("🔍 Usando solver Gecode...\n")
                 
                 success = self._run_minizinc_command(
-                    ["minizinc", "-I", os.path.dirname(self.model_path), "--solver", "gecode", "--time-limit", "120000", 
+                    [_minizinc_path(), "-I", self._model_dirname, "--solver", "gecode", "--time-limit", "120000", 
                     self.model_path, self.dzn_path],
                     suppress_dll_errors=False,
-                    cwd=os.path.dirname(self.model_path)
+                    cwd=self._model_dirname
                 )
 
             if self._is_interrupted:
                 if self._last_output_lines:
-                    self.outputReady.emit("⏸️ Interrumpido por el usuario, última salida conocida:\n")
+                    self.signals.outputReady[str].emit("⏸️ Interrumpido por el usuario, última salida conocida:\n")
                 else:
-                    self.outputReady.emit("[Proceso interrumpido sin salida previa]")
+                    self.signals.outputReady[str].emit("[Proceso interrumpido sin salida previa]")
             elif not success:
-                self.errorOccurred.emit("❌ Ejecución fallida con todos los solvers disponibles")
+                self.signals.errorOccurred.emit("❌ Ejecución fallida con todos los solvers disponibles")
 
         except Exception as e:
-            self.errorOccurred.emit(f"Excepción general: {str(e)}")
+            self.signals.errorOccurred.emit(f"Excepción general: {str(e)}")
 
         finally:
-            output_str = "\n".join(self._last_output_lines) if self._last_output_lines else ""
-            self.finished.emit(output_str, not self._is_interrupted and success)
-    
-    def _check_solver_available(self, solver_name):
+            self._cerrar_pipe_interrupcion()
+            output_str = "\n".join(self._last_output_lines)
+            success = not self._is_interrupted and success
+
+            # Parsear aquí, fuera del hilo de la interfaz
+            pol_str = q_final = x_matrices = None
+            if success:
+                try:
+                    pol_str, q_final, x_matrices = parse_minizinc_output(self._salida_para_parseo())
+                    if pol_str == POL_NO_ENCONTRADA:
+                        # Sin solución completa no hay nada que reportar ni guardar
+                        raise ValueError("la salida no contiene una solución completa")
+                except Exception as e:
+                    pol_str = q_final = x_matrices = None
+                    self.signals.errorOccurred.emit(f"Error al parsear la salida: {str(e)}")
+
+            self.signals.finished.emit(output_str, success, pol_str, q_final, x_matrices)
+
+class ConversionSignals(QObject):
+    """Señales de ConversionRunnable."""
+    # (éxito, ruta del DZN generado o mensaje de error)
+    terminado = pyqtSignal(bool, str)
+
+
+class ConversionRunnable(QRunnable):
+    """Convierte un TXT a DZN en el pool de hilos para no bloquear la interfaz con E/S."""
+    def __init__(self, txt_file_path, dzn_file_path):
+        super().__init__()
+        self.signals = ConversionSignals()
+        self.txt_file_path = txt_file_path
+        self.dzn_file_path = dzn_file_path
+
+    def run(self):
         try:
-            if solver_name.lower() == "gurobi":
-                # Intenta una ejecución de prueba simple
-                test_result = subprocess.run(
-                    ["minizinc", "--solver", "gurobi", "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                # Si hay error de DLL, retorna False
-                if "cannot load gurobi dll" in test_result.stderr.lower():
-                    return False
-            
-            result = subprocess.run(
-                ["minizinc", "--solvers"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return solver_name.lower() in result.stdout.lower()
-        except:
-            return False
+            en_directorio(os.path.dirname(self.dzn_file_path),
+                          convertir_txt_a_dzn, self.txt_file_path, self.dzn_file_path)
+        except Exception as e:
+            self.signals.terminado.emit(False, str(e))
+        else:
+            self.signals.terminado.emit(True, self.dzn_file_path)
 
 # ==================== STYLESHEET ====================
 DARK_MODE_STYLESHEET = """
@@ -287,6 +685,8 @@ DARK_MODE_STYLESHEET = """
         background-color: #242424;
         border-radius: 12px;
         border: 1px solid #333333;
+        border-top-color: #3d3d3d;
+        border-bottom: 2px solid #141414;
         padding: 12px;
     }
 
@@ -307,6 +707,8 @@ DARK_MODE_STYLESHEET = """
         background-color: #242424;
         border-radius: 12px;
         border: 1px solid #333333;
+        border-top-color: #3d3d3d;
+        border-bottom: 2px solid #141414;
         padding: 3px;
     }
 
@@ -406,6 +808,7 @@ DARK_MODE_STYLESHEET = """
         background-color: #1a2e1a;
         border-radius: 12px;
         border: 1px solid #10b981;
+        border-bottom: 2px solid #0b7a57;
         padding: 20px;
         margin: 10px;
     }
@@ -469,6 +872,46 @@ DARK_MODE_STYLESHEET = """
     }
 """
 
+# ==================== BOTONES ====================
+class _BotonSpec(NamedTuple):
+    attr: str          # Atributo de MinPolGUI donde se guarda el botón
+    texto: str
+    object_name: str   # Selector en DARK_MODE_STYLESHEET
+    altura: int
+    habilitado: bool
+    handler: str       # Nombre del método conectado a clicked
+
+
+_BOTON_IMPORTAR_TXT = _BotonSpec('import_txt_button', "Importar Archivo TXT", "tertiaryButton", 50, True, '_importar_archivo_txt')
+
+_BOTONES_ENTRADA = (
+    _BOTON_IMPORTAR_TXT,
+    _BotonSpec('import_dzn_button', "Importar Archivo DZN", "tertiaryButton", 50, True, '_importar_archivo_dzn'),
+)
+
+_BOTON_CAMBIAR_ARCHIVO = _BotonSpec('back_button', "Cambiar Archivo", "tertiaryButton", 45, True, '_volver_a_botones')
+
+_BOTONES_ACCIONES = (
+    _BotonSpec('execute_button', "Ejecutar Modelo", "primaryButton", 30, False, '_ejecutar_modelo'),
+    _BotonSpec('check_button', "Revisar Resultados", "secondaryButton", 55, False, '_revisar_resultados'),
+    _BotonSpec('stop_button', "Detener Ejecución", "stopButton", 55, True, '_stop_execution'),
+)
+
+def _set_enabled(widget, enabled):
+    """setEnabled solo si el estado cambia: evita reevaluar el estilo (:disabled) en vano."""
+    if widget.isEnabled() != enabled:
+        widget.setEnabled(enabled)
+
+
+def _set_visible(widget, visible):
+    """setVisible solo si el estado cambia (isHidden refleja el estado propio del widget)."""
+    if widget.isHidden() == visible:
+        widget.setVisible(visible)
+
+# Número de prueba en el nombre del archivo: "Prueba{N}" o, si no, cualquier número
+_PRUEBA_RE = re.compile(r'Prueba(\d+)', re.IGNORECASE)
+_ANY_NUM_RE = re.compile(r'(\d+)')
+
 # ==================== CLASE GUI ====================
 class MinPolGUI(QWidget):
     def __init__(self):
@@ -476,7 +919,7 @@ class MinPolGUI(QWidget):
         self.setObjectName("mainWindow")
         self.setWindowTitle("MinPol - Minimización de Polarización")
         self.setFixedSize(900, 750) 
-        self.setStyleSheet(DARK_MODE_STYLESHEET)
+        # La hoja de estilos se aplica una sola vez sobre QApplication (ver __main__)
         
         self.current_file_path = None
         self.current_dzn_path = None
@@ -484,6 +927,27 @@ class MinPolGUI(QWidget):
         self.last_output = None
         self.last_x_matrices = None
         self.last_polarizacion = None
+        self._current_runnable = None
+        self._conversion_runnable = None
+        # Parámetros del DZN actual y la clave (ruta, mtime, tamaño) con que se leyeron
+        self._dzn_params = None
+        self._dzn_params_clave = None
+        
+        # Pool propio de la ventana (no el global de Qt) para ejecuciones y
+        # conversiones. Sus hilos no expiran: cada ejecución reutiliza el mismo hilo
+        # en lugar de crear uno nuevo si pasaron más de 30 s desde la anterior.
+        # Hilos: la ejecución en curso, una detenida que aún está terminando y una
+        # conversión
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(_MAX_HILOS_POOL)
+        self.pool.setExpiryTimeout(-1)
+        
+        # Salida del solver pendiente de mostrar (se vuelca cada 50 ms)
+        self._pending_output = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_output)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(15, 15, 15, 15)
@@ -529,16 +993,41 @@ class MinPolGUI(QWidget):
         header_layout.addWidget(title_label)
         header_layout.addWidget(subtitle_label)
         
-        return self._apply_shadow(header_frame, 20)
+        return header_frame
 
     def _apply_shadow(self, widget, blur_radius=20):
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(blur_radius)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 4)
-        widget.setGraphicsEffect(shadow)
+        # Se conserva solo por compatibilidad; ya no se usa. Sin QGraphicsDropShadowEffect:
+        # obligaba a rasterizar y desenfocar la tarjeta en CPU en cada repintado. La
+        # profundidad se simula con bordes en la hoja de estilos.
         return widget
 
+    @contextlib.contextmanager
+    def _actualizacion_agrupada(self):
+        """
+        Suspende el repintado mientras se cambian varios widgets, para que Qt haga
+        un solo relayout y repintado por transición. Admite anidarse.
+        """
+        ya_suspendido = not self.updatesEnabled()
+        if not ya_suspendido:
+            self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            if not ya_suspendido:
+                self.setUpdatesEnabled(True)
+                self.update()
+
+    def _make_button(self, spec):
+        """Crea el botón descrito por `spec` y lo guarda en self.<spec.attr>."""
+        button = QPushButton(spec.texto)
+        button.setObjectName(spec.object_name)
+        button.setMinimumHeight(spec.altura)
+        if not spec.habilitado:
+            button.setEnabled(False)
+        button.clicked.connect(getattr(self, spec.handler))
+        setattr(self, spec.attr, button)
+        return button
+
     def _crear_tarjeta_entrada_datos(self):
         card = QFrame()
         card.setObjectName("cardFrame")
@@ -558,18 +1047,8 @@ class MinPolGUI(QWidget):
         entry_layout.setContentsMargins(12, 10, 12, 10)
         entry_layout.setSpacing(8)
 
-        self.import_txt_button = QPushButton("Importar Archivo TXT")
-        self.import_txt_button.setObjectName("tertiaryButton")
-        self.import_txt_button.setMinimumHeight(50)
-        self.import_txt_button.clicked.connect(self._importar_archivo_txt)
-
-        self.import_dzn_button = QPushButton("Importar Archivo DZN")
-        self.import_dzn_button.setObjectName("tertiaryButton")
-        self.import_dzn_button.setMinimumHeight(50)
-        self.import_dzn_button.clicked.connect(self._importar_archivo_dzn)
-
-        entry_layout.addWidget(self.import_txt_button)
-        entry_layout.addWidget(self.import_dzn_button)
+        for spec in _BOTONES_ENTRADA:
+            entry_layout.addWidget(self._make_button(spec))
 
         layout.addWidget(self.entry_buttons_container)
 
@@ -592,18 +1071,13 @@ class MinPolGUI(QWidget):
         ready_header.addWidget(self.check_icon)
         ready_header.addWidget(self.ready_text, 1)
         
-        self.back_button = QPushButton("Cambiar Archivo")
-        self.back_button.setObjectName("tertiaryButton")
-        self.back_button.setMinimumHeight(45)
-        self.back_button.clicked.connect(self._volver_a_botones)
-
         ready_layout.addLayout(ready_header)
-        ready_layout.addWidget(self.back_button)
+        ready_layout.addWidget(self._make_button(_BOTON_CAMBIAR_ARCHIVO))
             
         self.ready_container.setVisible(False)
         layout.addWidget(self.ready_container)
 
-        return self._apply_shadow(card)
+        return card
 
     def _crear_tarjeta_visualizacion(self):
         card = QFrame()
@@ -625,11 +1099,15 @@ class MinPolGUI(QWidget):
             QSizePolicy.Policy.Expanding
         )
         self.results_output.setReadOnly(True)
+        # Sin historial de deshacer y con un máximo de bloques, el costo de agregar
+        # salida no crece con la longitud de la ejecución
+        self.results_output.setUndoRedoEnabled(False)
+        self.results_output.document().setMaximumBlockCount(_MAX_BLOQUES_PANEL)
         self.results_output.setText("Ejecuta el modelo para ver los resultados aquí...")
         
         layout.addWidget(self.results_output, 1)
         
-        return self._apply_shadow(card)
+        return card
     
     def _crear_tarjeta_acciones(self):
         card = QFrame()
@@ -650,31 +1128,15 @@ class MinPolGUI(QWidget):
         buttons_layout.setContentsMargins(12, 10, 12, 10)
         buttons_layout.setSpacing(8)
 
-        self.execute_button = QPushButton("Ejecutar Modelo")
-        self.execute_button.setObjectName("primaryButton")
-        self.execute_button.setMinimumHeight(30)
-        self.execute_button.setEnabled(False)
-        self.execute_button.clicked.connect(self._ejecutar_modelo)
-
-        self.check_button = QPushButton("Revisar Resultados")
-        self.check_button.setObjectName("secondaryButton")
-        self.check_button.setMinimumHeight(55)
-        self.check_button.setEnabled(False)
-        self.check_button.clicked.connect(self._revisar_resultados)
-
-        self.stop_button = QPushButton("Detener Ejecución")
-        self.stop_button.setObjectName("stopButton")
-        self.stop_button.setMinimumHeight(55)
-        self.stop_button.clicked.connect(self._stop_execution)
-        self.stop_button.setVisible(False)
+        for spec in _BOTONES_ACCIONES:
+            buttons_layout.addWidget(self._make_button(spec))
 
-        buttons_layout.addWidget(self.execute_button)
-        buttons_layout.addWidget(self.check_button)
-        buttons_layout.addWidget(self.stop_button)
+        # Detener solo aparece mientras hay una ejecución en curso
+        self.stop_button.setVisible(False)
 
         layout.addWidget(buttons_container)
         
-        return self._apply_shadow(card)
+        return card
 
     # ==================== MÉTODOS LÓGICOS ====================
     
@@ -685,24 +1147,25 @@ class MinPolGUI(QWidget):
         """
         filename = os.path.basename(file_path)
         # Buscar patrón: Prueba{NUMERO} o cualquier número en el nombre
-        match = re.search(r'Prueba(\d+)', filename, re.IGNORECASE)
+        match = _PRUEBA_RE.search(filename)
         if match:
             return match.group(1)
         # Si no encuentra "Prueba", buscar cualquier número
-        match = re.search(r'(\d+)', filename)
+        match = _ANY_NUM_RE.search(filename)
         if match:
             return match.group(1)
         return ""
     
     def _volver_a_botones(self):
-        self.entry_buttons_container.setVisible(True)
-        self.ready_container.setVisible(False)
         self.current_file_path = None
         self.current_dzn_path = None
         self.numero_prueba = None
-        self.execute_button.setEnabled(False)
-        self.check_button.setEnabled(False)
-        self.results_output.setText("Ejecuta el modelo para ver los resultados aquí...")
+        with self._actualizacion_agrupada():
+            _set_visible(self.entry_buttons_container, True)
+            _set_visible(self.ready_container, False)
+            _set_enabled(self.execute_button, False)
+            _set_enabled(self.check_button, False)
+            self.results_output.setText("Ejecuta el modelo para ver los resultados aquí...")
 
     def _importar_archivo_txt(self):
         options = QFileDialog.Option.ReadOnly
@@ -714,13 +1177,8 @@ class MinPolGUI(QWidget):
         if file_path:
             self.current_file_path = file_path
             self.numero_prueba = self._extraer_numero_prueba(file_path)
-            success = self._convertir_txt_a_dzn(file_path)
-            
-            if success:
-                self.ready_text.setText(f"{os.path.basename(self.current_file_path)} correctamente cargado")
-                self._mostrar_estado_listo()
-            else:
-                self._limpiar_estado_archivos()
+            # La conversión sigue en segundo plano (ver _on_conversion_terminada)
+            self._convertir_txt_a_dzn(file_path)
 
     def _importar_archivo_dzn(self):
         options = QFileDialog.Option.ReadOnly
@@ -737,221 +1195,268 @@ class MinPolGUI(QWidget):
             self._mostrar_estado_listo()
 
     def _mostrar_estado_listo(self):
-        self.entry_buttons_container.setVisible(False)
-        self.ready_container.setVisible(True)
-        self.execute_button.setEnabled(True)
-        self.check_button.setEnabled(False)
+        with self._actualizacion_agrupada():
+            _set_visible(self.entry_buttons_container, False)
+            _set_visible(self.ready_container, True)
+            _set_enabled(self.execute_button, True)
+            _set_enabled(self.check_button, False)
 
     def _limpiar_estado_archivos(self):
         self.current_file_path = None
         self.current_dzn_path = None
         self.numero_prueba = None
-        self.execute_button.setEnabled(False)
-        self.check_button.setEnabled(False)
+        _set_enabled(self.execute_button, False)
+        _set_enabled(self.check_button, False)
+
+    def _ruta_datos_proyecto(self):
+        """Ruta de DatosProyecto/DatosProyecto{N}.dzn para la prueba actual."""
+        # Determinar el nombre del archivo DZN con el número de prueba
+        if self.numero_prueba:
+            dzn_filename = f"DatosProyecto{self.numero_prueba}.dzn"
+        else:
+            dzn_filename = "DatosProyecto.dzn"
+        proyecto_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "DatosProyecto")
+        return os.path.join(os.path.normpath(proyecto_dir), dzn_filename)
+
+    def _get_dzn_params(self):
+        """Parámetros del DZN actual; solo se vuelve a parsear si el archivo cambió."""
+        dzn_stat = os.stat(self.current_dzn_path)
+        clave = (self.current_dzn_path, dzn_stat.st_mtime_ns, dzn_stat.st_size)
+        if clave != self._dzn_params_clave:
+            self._dzn_params = parse_dzn_input(self.current_dzn_path)
+            self._dzn_params_clave = clave
+        return self._dzn_params
 
     def _convertir_txt_a_dzn(self, txt_file_path):
-        try:
-            import tempfile
-            
-            # Crear archivo DZN temporal sin crear directorios en BateriaPruebas
-            base_name = os.path.splitext(os.path.basename(txt_file_path))[0]
-            temp_dir = tempfile.gettempdir()
-            dzn_file_path = os.path.join(temp_dir, f"{base_name}.dzn")
-            self.current_dzn_path = dzn_file_path
-            
-            with open(txt_file_path, 'r') as txt_file:
-                lines = [line.strip() for line in txt_file.readlines() if line.strip()]
-            
-            if len(lines) < 7:
-                raise ValueError("El archivo no tiene el formato esperado (mínimo 7 líneas).")
-            
-            n = lines[0]
-            m = int(lines[1])
-            p = '[' + lines[2].replace(',', ', ') + ']'
-            v = '[' + lines[3].replace(',', ', ') + ']'
-            
-            matrix_lines = []
-            if len(lines) < 4 + m:
-                raise ValueError(f"El valor de 'm' ({m}) no coincide con la cantidad de filas esperadas.")
-                
-            for i in range(m):
-                matrix_lines.append(lines[4 + i])
-            
-            s_content = ' |\n        '.join(matrix_lines)
-            s = f"[| {s_content} |]"
-            
-            ct = lines[4 + m]
-            maxMovs = lines[5 + m]
-            
-            with open(dzn_file_path, 'w') as dzn_file:
-                dzn_file.write(f"n = {n};\n")
-                dzn_file.write(f"m = {m};\n\n")
-                dzn_file.write(f"p = {p};\n\n")
-                dzn_file.write(f"v = {v};\n\n")
-                dzn_file.write(f"s = {s};\n\n")
-                dzn_file.write(f"ct = {ct};\n\n")
-                dzn_file.write(f"maxMovs = {maxMovs};")
-                
-            return True
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error de Conversión", f"Error al convertir archivo:\n{str(e)}")
-            self.results_output.setText(f"❌ Error al convertir archivo:\n{str(e)}")
-            return False
+        """Lanza la conversión TXT → DZN en el pool de hilos; el resultado llega a _on_conversion_terminada."""
+        # El DZN se genera directamente en DatosProyecto (no en BateriaPruebas), donde
+        # lo usará la ejecución, en lugar de pasar por un archivo temporal y copiarlo
+        dzn_file_path = self._ruta_datos_proyecto()
+        
+        # Sin importar otro archivo mientras se convierte este; el botón indica el progreso
+        _set_enabled(self.import_txt_button, False)
+        _set_enabled(self.import_dzn_button, False)
+        self.import_txt_button.setText("Convirtiendo…")
+        
+        self._conversion_runnable = ConversionRunnable(txt_file_path, dzn_file_path)
+        self._conversion_runnable.signals.terminado.connect(self._on_conversion_terminada)
+        self.pool.start(self._conversion_runnable)
+
+    def _on_conversion_terminada(self, success, resultado):
+        self._conversion_runnable = None
+        self.import_txt_button.setText(_BOTON_IMPORTAR_TXT.texto)
+        _set_enabled(self.import_txt_button, True)
+        _set_enabled(self.import_dzn_button, True)
+        
+        if success:
+            self.current_dzn_path = resultado
+            self.ready_text.setText(f"{os.path.basename(self.current_file_path)} correctamente cargado")
+            self._mostrar_estado_listo()
+        else:
+            QMessageBox.critical(self, "Error de Conversión", f"Error al convertir archivo:\n{resultado}")
+            self.results_output.setText(f"❌ Error al convertir archivo:\n{resultado}")
+            self._limpiar_estado_archivos()
 
     def _ejecutar_modelo(self):
-        self.import_txt_button.setEnabled(False)
-        self.import_dzn_button.setEnabled(False)
-        self.execute_button.setEnabled(False)
-        self.check_button.setEnabled(False)
+        _set_enabled(self.import_txt_button, False)
+        _set_enabled(self.import_dzn_button, False)
+        _set_enabled(self.execute_button, False)
+        _set_enabled(self.check_button, False)
         
-        if self.current_dzn_path and os.path.exists(self.current_dzn_path):
+        try:
+            model_path, dzn_path = _validar_rutas(
+                os.path.join(os.path.dirname(__file__), "../Proyecto.mzn"), self.current_dzn_path
+            )
+        except FileNotFoundError as e:
+            self.results_output.setText(f"❌ Error: {str(e)}")
+            self._set_ui_during_execution(False)
+            _set_enabled(self.execute_button, True)
+            return
+        
+        try:
+            self._set_ui_during_execution(True)
+            self._pending_output.clear()
+            self.results_output.clear()
+
+            # Crear directorio DatosProyecto y guardar los datos de prueba
+            datos_proyecto_path = self._ruta_datos_proyecto()
+            proyecto_dir, dzn_filename = os.path.split(datos_proyecto_path)
             try:
-                self._set_ui_during_execution(True)
-                self.results_output.clear()
+                # Los TXT importados ya se convirtieron directamente en este destino;
+                # solo se copia un DZN importado desde otra ubicación (creando el
+                # directorio si hace falta). La copia es a nivel del sistema operativo
+                # (sendfile / CopyFileW).
+                if os.path.normcase(os.fspath(dzn_path)) != os.path.normcase(datos_proyecto_path):
+                    try:
+                        en_directorio(proyecto_dir, shutil.copyfile, dzn_path, datos_proyecto_path)
+                    except shutil.SameFileError:
+                        pass  # Mismo archivo por otra ruta (enlace, mayúsculas)
                 
-                model_path = os.path.join(os.path.dirname(__file__), "../Proyecto.mzn")
-                
-                if not os.path.exists(model_path):
-                    self.results_output.setText(f"❌ Error: No se encontró Proyecto.mzn")
-                    self._set_ui_during_execution(False)
-                    self.execute_button.setEnabled(True)
-                    return
-
-                # Crear directorio DatosProyecto y guardar los datos de prueba
-                proyecto_dir = os.path.join(os.path.dirname(model_path), "DatosProyecto")
-                try:
-                    # Crear el directorio si no existe
-                    os.makedirs(proyecto_dir, exist_ok=True)
-                    
-                    # Determinar el nombre del archivo DZN con el número de prueba
-                    if self.numero_prueba:
-                        dzn_filename = f"DatosProyecto{self.numero_prueba}.dzn"
-                    else:
-                        dzn_filename = "DatosProyecto.dzn"
-                    
-                    # Guardar el archivo DZN en el directorio
-                    datos_proyecto_path = os.path.join(proyecto_dir, dzn_filename)
-                    with open(self.current_dzn_path, 'r') as source_file:
-                        dzn_content = source_file.read()
-                    
-                    with open(datos_proyecto_path, 'w') as target_file:
-                        target_file.write(dzn_content)
-                    
-                    # Mostrar mensaje inicial con información del directorio creado
-                    initial_message = f"Ejecutando modelo... Por favor espere.\n\n✓ Directorio DatosProyecto creado con {dzn_filename}\n\n"
-                    self.results_output.setText(initial_message)
-                    # Mover el cursor al final para que la salida de MiniZinc se agregue después
-                    cursor = self.results_output.textCursor()
-                    cursor.movePosition(cursor.MoveOperation.End)
-                    self.results_output.setTextCursor(cursor)
-                    
-                except Exception as e:
-                    self.results_output.setText(f"❌ Error al crear directorio DatosProyecto:\n{str(e)}")
-                    self._set_ui_during_execution(False)
-                    self.execute_button.setEnabled(True)
-                    return
-
-                self.thread = QThread()
-                self.worker = MinizincWorker(dzn_path=datos_proyecto_path, model_path=model_path)
-                self.worker.moveToThread(self.thread)
-
-                self.thread.started.connect(self.worker.run)
-                self.worker.outputReady.connect(self._update_output)
-                self.worker.finished.connect(self._on_minizinc_finished)
-                self.worker.errorOccurred.connect(lambda err: self.results_output.append(f"🔴 ERROR: {err}\n"))
-
-                self.worker.finished.connect(self.thread.quit)
-                self.worker.finished.connect(self.worker.deleteLater)
-                self.thread.finished.connect(self.thread.deleteLater)
-
-                self.thread.start()
+                # Mostrar mensaje inicial con información del directorio creado
+                initial_message = f"Ejecutando modelo... Por favor espere.\n\n✓ Directorio DatosProyecto creado con {dzn_filename}\n\n"
+                self.results_output.setText(initial_message)
+                # Mover el cursor al final para que la salida de MiniZinc se agregue después
+                self.results_output.moveCursor(QTextCursor.MoveOperation.End)
                 
             except Exception as e:
-                self.results_output.setText(f"❌ Error al ejecutar:\n{str(e)}")
+                self.results_output.setText(f"❌ Error al crear directorio DatosProyecto:\n{str(e)}")
                 self._set_ui_during_execution(False)
-                self.execute_button.setEnabled(True)
-        else:
-            self.results_output.setText("❌ Error: No hay archivo DZN válido.")
-            self.execute_button.setEnabled(True)
+                _set_enabled(self.execute_button, True)
+                return
 
-    def _on_minizinc_finished(self, output, success):
-        self.stop_button.setVisible(False)
-        self.execute_button.setEnabled(True)
+            self._current_runnable = MinizincRunnable(
+                dzn_path=datos_proyecto_path, model_path=model_path, signals=self._crear_senales_ejecucion()
+            )
+
+            # El pool reutiliza sus hilos entre ejecuciones y libera el runnable al terminar
+            self.pool.start(self._current_runnable)
+            
+        except Exception as e:
+            self.results_output.setText(f"❌ Error al ejecutar:\n{str(e)}")
+            self._set_ui_during_execution(False)
+            _set_enabled(self.execute_button, True)
+
+    def _crear_senales_ejecucion(self):
+        """
+        Señales propias de una ejecución. Una ejecución detenida puede seguir
+        emitiendo después de que empezó la siguiente; con un objeto por ejecución
+        los slots reconocen (con sender()) y descartan esas señales atrasadas.
+        """
+        signals = MinizincSignals(self)
+        signals.outputReady[list].connect(self._update_output)
+        signals.outputReady[str].connect(self._update_output)
+        signals.finished.connect(self._on_minizinc_finished)
+        signals.errorOccurred.connect(self._on_worker_error)
+        return signals
+
+    def _es_senal_actual(self, signals):
+        """True si `signals` pertenece a la ejecución en curso."""
+        return self._current_runnable is not None and signals is self._current_runnable.signals
+
+    def _on_minizinc_finished(self, output, success, pol_str, q_final, x_matrices):
+        # finished es la última señal de una ejecución: su objeto de señales ya no se usa
+        signals = self.sender()
+        signals.deleteLater()
+        if not self._es_senal_actual(signals):
+            return  # Ejecución detenida y reemplazada por otra
         
-        try:
-            if hasattr(self, 'worker'):
-                del self.worker
+        # Todos los cambios de botones y del panel se repintan una sola vez
+        with self._actualizacion_agrupada():
+            _set_visible(self.stop_button, False)
+            _set_enabled(self.execute_button, True)
+        
+            # Los mensajes se acumulan y se agregan al panel con un solo append al final
+            # (cada append equivale a un párrafo, por eso se unen con saltos de línea)
+            parts = []
+            try:
+                self._current_runnable = None
             
-            self.last_output = output
-            self.results_output.append("\n" + "="*60 + "\n")
-            self.results_output.append("Ejecución Finalizada\n")
-            self.results_output.append("="*60 + "\n\n")
+                # Mostrar primero la salida pendiente para respetar el orden
+                self._flush_output()
             
-            if success:
-                try:
-                    pol_str, q_final, x_matrices = parse_minizinc_output(output)
-                    self.last_x_matrices = x_matrices
-                    self.last_polarizacion = pol_str
-
-                    if pol_str == "0" and q_final == []:
-                        result_text = "⚠️ ADVERTENCIA: Parser no extrajo resultados correctamente.\n"
-                        result_text += "Revisa la salida completa arriba.\n"
-                    else:
-                        result_text = "ÉXITO!\n\n"
-                        result_text += f"🎯 Polarización mínima: {pol_str}\n\n"
-                        result_text += f"📊 Distribución final: {q_final}\n\n"
+                self.last_output = output
+                parts.append("\n" + "="*60 + "\n")
+                parts.append("Ejecución Finalizada\n")
+                parts.append("="*60 + "\n\n")
+            
+                if success and pol_str is None:
+                    # El worker ya reportó el detalle del error de parseo
+                    parts.append("❌ ERROR al parsear la salida de MiniZinc\n")
+                    _set_enabled(self.check_button, False)
+                elif success:
+                    try:
+                        self.last_x_matrices = x_matrices
+                        self.last_polarizacion = pol_str
+
+                        if pol_str == "0" and q_final == []:
+                            result_text = "⚠️ ADVERTENCIA: Parser no extrajo resultados correctamente.\n"
+                            result_text += "Revisa la salida completa arriba.\n"
+                        else:
+                            result_text = "ÉXITO!\n\n"
+                            result_text += f"🎯 Polarización mínima: {pol_str}\n\n"
+                            result_text += f"📊 Distribución final: {q_final}\n\n"
                         
-                        # Guardar solución en archivo .txt con el formato requerido
-                        try:
-                            solucion_filename = self._guardar_solucion_txt(pol_str, x_matrices)
-                            result_text += f"💾 Solución guardada en {solucion_filename}\n\n"
-                        except Exception as e:
-                            result_text += f"⚠️ Error al guardar solución: {str(e)}\n\n"
+                            # Guardar solución en archivo .txt con el formato requerido
+                            try:
+                                solucion_filename = self._guardar_solucion_txt(pol_str, x_matrices)
+                                result_text += f"💾 Solución guardada en {solucion_filename}\n\n"
+                            except Exception as e:
+                                result_text += f"⚠️ Error al guardar solución: {str(e)}\n\n"
                         
-                        result_text += "💡 Presiona 'Revisar Resultados' para verificar la solución.\n"
+                            result_text += "💡 Presiona 'Revisar Resultados' para verificar la solución.\n"
                     
-                    self.results_output.append(result_text)
-                    self.check_button.setEnabled(True)
+                        parts.append(result_text)
+                        _set_enabled(self.check_button, True)
 
-                except Exception as e:
-                    self.results_output.append(f"❌ ERROR al parsear:\n{str(e)}\n")
-                    self.check_button.setEnabled(False)
-            else:
-                self.results_output.append("❌ EJECUCIÓN FALLIDA\n")
-                self.results_output.append("Verifica que MiniZinc y los solvers estén correctamente instalados.\n")
-                self.check_button.setEnabled(False)
+                    except Exception as e:
+                        parts.append(f"❌ ERROR al procesar resultados:\n{str(e)}\n")
+                        _set_enabled(self.check_button, False)
+                else:
+                    parts.append("❌ EJECUCIÓN FALLIDA\n")
+                    parts.append("Verifica que MiniZinc y los solvers estén correctamente instalados.\n")
+                    _set_enabled(self.check_button, False)
 
-        finally:
-            self._set_ui_during_execution(False)
-            
-    def _update_output(self, text):
-        # Usar append en lugar de insertPlainText para agregar al final
-        self.results_output.moveCursor(self.results_output.textCursor().MoveOperation.End)
+            finally:
+                if parts:
+                    self.results_output.append("\n".join(parts))
+                self._set_ui_during_execution(False)
+
+    def _update_output(self, salida):
+        # Acumular la salida y volcarla como máximo cada 50 ms: un solo
+        # insertPlainText/ensureCursorVisible por tanda en lugar de uno por bloque.
+        # `salida` es un lote de líneas (list) o un mensaje de estado (str).
+        signals = self.sender()
+        if isinstance(salida, list):
+            # Devolver el permiso a la ejecución que envió el lote, aunque sea una
+            # ejecución detenida cuyo lote se descarta
+            signals.lote_consumido()
+        if not self._es_senal_actual(signals):
+            return
+        if isinstance(salida, list):
+            self._pending_output.append("\n".join(salida))
+            self._pending_output.append("\n")
+        else:
+            self._pending_output.append(salida)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_output(self):
+        self._flush_timer.stop()
+        if not self._pending_output:
+            return
+        
+        text = "".join(self._pending_output)
+        self._pending_output.clear()
+        self.results_output.moveCursor(QTextCursor.MoveOperation.End)
         self.results_output.insertPlainText(text)
         self.results_output.ensureCursorVisible()
     
+    def _on_worker_error(self, err):
+        if not self._es_senal_actual(self.sender()):
+            return
+        self._flush_output()
+        self.results_output.append(f"🔴 ERROR: {err}\n")
+    
     def _set_ui_during_execution(self, executing):
-        self.import_txt_button.setEnabled(not executing)
-        self.import_dzn_button.setEnabled(not executing)
-        self.execute_button.setVisible(not executing)
-        self.check_button.setVisible(not executing)
-        self.stop_button.setVisible(executing)
+        with self._actualizacion_agrupada():
+            _set_enabled(self.import_txt_button, not executing)
+            _set_enabled(self.import_dzn_button, not executing)
+            _set_visible(self.execute_button, not executing)
+            _set_visible(self.check_button, not executing)
+            _set_visible(self.stop_button, executing)
     
     def _stop_execution(self):
-        if hasattr(self, 'worker'):
-            self.worker.interrupt()
+        if self._current_runnable is not None:
+            self._current_runnable.interrupt()
         
-        if hasattr(self, 'thread') and self.thread.isRunning():
-            self.thread.quit()
-            self.thread.wait()
-        
-        self._set_ui_during_execution(False)
-        self.results_output.append("\n\n🛑 EJECUCIÓN DETENIDA POR EL USUARIO\n")
-        self.execute_button.setEnabled(True)
-        self.check_button.setEnabled(False)
+        with self._actualizacion_agrupada():
+            self._set_ui_during_execution(False)
+            self._flush_output()
+            self.results_output.append("\n\n🛑 EJECUCIÓN DETENIDA POR EL USUARIO\n")
+            _set_enabled(self.execute_button, True)
+            _set_enabled(self.check_button, False)
     
-    def _guardar_solucion_txt(self, polarizacion_str: str, x_matrices: List[List[List[int]]]) -> str:
+    def _guardar_solucion_txt(self, polarizacion_str: str, x_matrices: np.ndarray) -> str:
         """
         Guarda la solución en un archivo .txt con el formato requerido:
         1. Línea 1: polarización final (entero)
@@ -976,14 +1481,11 @@ class MinPolGUI(QWidget):
             model_path = os.path.join(os.path.dirname(__file__), "../Proyecto.mzn")
             proyecto_dir = os.path.join(os.path.dirname(model_path), "DatosProyecto")
             
-            # Crear el directorio si no existe
-            os.makedirs(proyecto_dir, exist_ok=True)
-            
             # Obtener m (número de opiniones) del archivo DZN
             m = 3  # valor por defecto
             if self.current_dzn_path:
                 try:
-                    params = parse_dzn_input(self.current_dzn_path)
+                    params = self._get_dzn_params()
                     m = params.get('m', 3)
                 except:
                     pass
@@ -997,41 +1499,25 @@ class MinPolGUI(QWidget):
             # Ruta del archivo de solución
             solucion_path = os.path.join(proyecto_dir, solucion_filename)
             
-            # Escribir el archivo con el formato requerido
-            with open(solucion_path, 'w') as f:
-                # Línea 1: Polarización final (entero)
-                f.write(f"{polarizacion_int}\n")
-                
-                # Para cada nivel de resistencia k = 1, 2, 3
-                for k in range(3):  # k = 0, 1, 2 corresponde a resistencia 1, 2, 3
-                    nivel_resistencia = k + 1
-                    
-                    # Línea con el nivel de resistencia
-                    f.write(f"{nivel_resistencia}\n")
-                    
-                    # Obtener la matriz de movimientos para este nivel
-                    if k < len(x_matrices) and x_matrices[k] and len(x_matrices[k]) > 0:
-                        matriz_k = x_matrices[k]
-                        
-                        # Escribir las m filas de la matriz
-                        for i in range(m):
-                            if i < len(matriz_k):
-                                fila = matriz_k[i]
-                                # Asegurar que la fila tenga m columnas
-                                valores = []
-                                for j in range(m):
-                                    if j < len(fila):
-                                        valores.append(str(int(fila[j])))
-                                    else:
-                                        valores.append("0")
-                                f.write(",".join(valores) + "\n")
-                            else:
-                                # Si falta la fila, escribir ceros
-                                f.write(",".join(["0"] * m) + "\n")
-                    else:
-                        # Si no hay matriz, escribir m filas de ceros
-                        for i in range(m):
-                            f.write(",".join(["0"] * m) + "\n")
+            # Ajustar las matrices (3, m', m') del parser a (3, m, m): lo que sobra se
+            # descarta y las filas o columnas faltantes quedan en cero
+            X = np.zeros((3, m, m), dtype=np.int64)
+            k_max, i_max, j_max = (min(a, b) for a, b in zip(x_matrices.shape, X.shape))
+            X[:k_max, :i_max, :j_max] = x_matrices[:k_max, :i_max, :j_max]
+            
+            # Armar el contenido completo en memoria y escribirlo con una sola llamada;
+            # las filas de cada matriz las formatea np.savetxt
+            buffer = io.StringIO()
+            # Línea 1: Polarización final (entero)
+            buffer.write(f"{polarizacion_int}\n")
+            
+            # Para cada nivel de resistencia k = 1, 2, 3 (línea con el nivel y m filas)
+            for k in range(3):  # k = 0, 1, 2 corresponde a resistencia 1, 2, 3
+                buffer.write(f"{k + 1}\n")
+                np.savetxt(buffer, X[k], fmt='%d', delimiter=',')
+            
+            # Escribir creando el directorio si no existe (o si se borró en la sesión)
+            en_directorio(proyecto_dir, Path(solucion_path).write_text, buffer.getvalue())
             
             return solucion_filename
             
@@ -1039,9 +1525,9 @@ class MinPolGUI(QWidget):
             raise Exception(f"Error al guardar solución: {str(e)}")
     
     def _revisar_resultados(self):
-        if self.last_output and self.last_x_matrices:
+        if self.last_output and self.last_x_matrices is not None:
             try:
-                params = parse_dzn_input(self.current_dzn_path)
+                params = self._get_dzn_params()
 
                 verification_output = verificar_solucion(
                     x=self.last_x_matrices,
@@ -1058,8 +1544,8 @@ class MinPolGUI(QWidget):
                 self.results_output.setText("🔍 VERIFICACIÓN DE RESULTADOS\n\n")
                 self.results_output.append(verification_output)
                 
-                self.execute_button.setEnabled(False)
-                self.check_button.setEnabled(False)
+                _set_enabled(self.execute_button, False)
+                _set_enabled(self.check_button, False)
                 
             except Exception as e:
                 QMessageBox.critical(
@@ -1075,13 +1561,46 @@ class MinPolGUI(QWidget):
             )
 
 
+def _main_lote(args):
+    """Modo por lotes: `python main.py --batch DIR [DIR_SALIDA]` convierte sin abrir la GUI."""
+    if not args:
+        print("Uso: python main.py --batch DIR [DIR_SALIDA]", file=sys.stderr)
+        return 2
+    
+    if not os.path.isdir(args[0]):
+        print(f"❌ No es un directorio: {args[0]}", file=sys.stderr)
+        return 2
+    
+    try:
+        resultados = convertir_lote(args[0], args[1] if len(args) > 1 else None)
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    
+    errores = 0
+    for txt_file_path, error in resultados:
+        if error:
+            errores += 1
+            print(f"❌ {os.path.basename(txt_file_path)}: {error}", file=sys.stderr)
+        else:
+            print(f"✓ {os.path.basename(txt_file_path)}")
+    print(f"{len(resultados) - errores} de {len(resultados)} archivos convertidos")
+    return 1 if errores else 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        sys.exit(_main_lote(sys.argv[2:]))
+    
     app = QApplication(sys.argv)
     
     # Aplicar fuente moderna en toda la aplicación
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     
+    # Estilo global: Qt parsea la hoja una vez y la comparte entre todos los widgets
+    app.setStyleSheet(DARK_MODE_STYLESHEET)
+    
     window = MinPolGUI()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Kernels opcionales del verificador compilados con Numba.
+
+Numba no es una dependencia obligatoria: si no está instalado, `calcular_metricas`
+es None y `verificar_solucion` usa solo operaciones de NumPy.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional
+    njit = None
+
+
+def _calcular_metricas(X, p, v, n):
+    """
+    Recorre X (3, m, m) una sola vez y calcula, sin arreglos temporales de m×m:
+    costo total, movimientos totales, distribución final q, mediana ponderada y
+    polarización. Misma semántica que el camino de NumPy de `verificar_solucion`.
+    """
+    m = X.shape[1]
+    resistencia = np.array([1.0, 1.5, 2.0])
+    costo = 0.0
+    movs = 0
+    salidas = np.zeros(m, np.int64)
+    llegadas = np.zeros(m, np.int64)
+
+    for k in range(3):
+        costo_k = 0.0
+        for i in range(m):
+            for j in range(m):
+                xv = X[k, i, j]
+                salidas[i] += xv
+                llegadas[j] += xv
+                d = abs(i - j)
+                movs += xv * d
+                # Solo los movimientos positivos suman costo
+                if xv > 0:
+                    costo_k += xv * d
+        costo += costo_k * resistencia[k]
+
+    q = p - salidas + llegadas
+
+    # Primera opinión cuya frecuencia acumulada alcanza la posición de la mediana
+    pos_mediana = (n + 1) // 2
+    acum = 0
+    idx_mediana = 0
+    for i in range(m):
+        acum += q[i]
+        if acum >= pos_mediana:
+            idx_mediana = i
+            break
+    mediana = v[idx_mediana]
+
+    polarizacion = 0.0
+    for i in range(m):
+        polarizacion += q[i] * abs(v[i] - mediana)
+
+    return costo, movs, q, mediana, polarizacion
+
+
+# Sin fastmath: las sumas conservan el orden IEEE y el reporte coincide con el de NumPy
+calcular_metricas = njit(cache=True)(_calcular_metricas) if njit is not None else None
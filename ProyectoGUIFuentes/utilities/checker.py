@@ -1,13 +1,46 @@
 import numpy as np
-from typing import List
+from typing import List, Union
 
-def verificar_solucion(x: List[List[List[int]]], p: List[int], s: List[List[int]], 
+from utilities._checker_kernels import calcular_metricas
+
+# A partir de este m se usa el kernel de Numba (si está instalado); para instancias
+# pequeñas NumPy ya es suficientemente rápido y se evita la compilación
+_M_MINIMO_KERNEL = 64
+
+# Separador de las secciones del reporte
+_BANNER = "=" * 60
+
+
+def _calcular_metricas_numpy(X, p_array, v_array, n, D, resistencia):
+    """Costo total, movimientos totales, q final, mediana y polarización con NumPy."""
+    # Salidas y llegadas de cada opinión
+    salidas = X.sum(axis=(0, 2))
+    llegadas = X.sum(axis=(0, 1))
+    q_array = (p_array - salidas + llegadas).astype(np.int64)
+    
+    # Solo cuentan los movimientos positivos fuera de la diagonal (D ya es 0 en ella)
+    costo_por_k = (np.where(X > 0, X, 0) * D).sum(axis=(1, 2))
+    costo_total = float((costo_por_k * resistencia).sum())
+    movimientos_totales = int((X * D).sum())
+    
+    # Mediana ponderada: primera opinión cuya frecuencia acumulada alcanza la
+    # posición de la mediana. En una solución inválida q puede tener valores
+    # negativos y la acumulada no es monótona, por eso se usa argmax sobre la
+    # máscara en vez de búsqueda binaria (si ninguna la alcanza, argmax da 0)
+    pos_mediana = (n + 1) // 2
+    mediana = float(v_array[int(np.argmax(np.cumsum(q_array) >= pos_mediana))])
+    polarizacion = float(np.abs(v_array - mediana) @ q_array)
+    
+    return costo_total, movimientos_totales, q_array, mediana, polarizacion
+
+
+def verificar_solucion(x: Union[np.ndarray, List[List[List[int]]]], p: List[int], s: List[List[int]], 
                        v: List[float], n: int, m: int, ct_max: float, maxMovs: float) -> str:
     """
     Verifica la validez de una solución para el problema MinPol.
     
     Parámetros:
-        x: Lista de 3 matrices m×m (una por nivel de resistencia k=1,2,3)
+        x: Arreglo (3, m, m) o lista de 3 matrices m×m (una por nivel de resistencia k=1,2,3)
         p: Distribución inicial de personas por opinión
         s: Matriz m×3 con cantidad de personas por opinión y resistencia
         v: Valores de las opiniones
@@ -21,33 +54,56 @@ def verificar_solucion(x: List[List[List[int]]], p: List[int], s: List[List[int]
     """
     
     result = []
-    result.append("=" * 60)
+    result.append(_BANNER)
     result.append("VERIFICACIÓN DE SOLUCIÓN - MinPol")
-    result.append("=" * 60)
+    result.append(_BANNER)
     result.append("")
     
-    # Convertir a numpy arrays para facilitar cálculos
-    x_arrays = [np.array(x[k]) for k in range(3)]  # x[0]=baja, x[1]=media, x[2]=alta
-    p_array = np.array(p)
-    s_array = np.array(s)
-    v_array = np.array(v)
+    # Convertir a numpy arrays: todas las restricciones se calculan con operaciones
+    # vectorizadas sobre el arreglo X de forma (3, m, m)
+    # (si x ya es el arreglo int64 del parser no se copia)
+    X = np.asarray(x, dtype=np.int64)  # X[0]=baja, X[1]=media, X[2]=alta
+    p_array = np.asarray(p)
+    s_array = np.asarray(s)
+    v_array = np.asarray(v)
     
     # Factores de resistencia
-    resistencia = [1.0, 1.5, 2.0]
+    resistencia = np.array([1.0, 1.5, 2.0])
+    
+    # Distancia entre opiniones |i - j| (cero en la diagonal)
+    indices = np.arange(m)
+    D = np.abs(np.subtract.outer(indices, indices))
+    
+    # Métricas de las restricciones 3-5 y de la polarización: en una sola pasada
+    # compilada para m grande, o con reducciones de NumPy
+    if calcular_metricas is not None and m >= _M_MINIMO_KERNEL:
+        costo_total, movimientos_totales, q_array, mediana, polarizacion = calcular_metricas(
+            np.ascontiguousarray(X), p_array.astype(np.int64), v_array.astype(np.float64), n
+        )
+        costo_total, movimientos_totales = float(costo_total), int(movimientos_totales)
+        mediana, polarizacion = float(mediana), float(polarizacion)
+    else:
+        costo_total, movimientos_totales, q_array, mediana, polarizacion = _calcular_metricas_numpy(
+            X, p_array, v_array, n, D, resistencia
+        )
     
     valido = True
     
     # ===== RESTRICCIÓN 1: No mover más personas de las disponibles por resistencia =====
     result.append("📋 Restricción 1: Conservación por resistencia")
-    for k in range(3):
-        for i in range(m):
-            movimientos_desde_i = x_arrays[k][i].sum()
-            disponibles = s_array[i][k]
-            
-            if movimientos_desde_i > disponibles:
-                result.append(f"  ❌ Resistencia {k+1}, Opinión {i+1}: se mueven {movimientos_desde_i} "
-                            f"pero solo hay {disponibles} disponibles")
-                valido = False
+    movimientos_desde = X.sum(axis=2)   # (3, m): personas que salen de i con resistencia k
+    disponibles = s_array.T             # (3, m)
+    # Las violaciones se reúnen como tuplas (k, i, movidas, disponibles) y solo se
+    # formatean si existen
+    ks, opiniones = np.nonzero(movimientos_desde > disponibles)
+    if len(ks):
+        result.extend(
+            f"  ❌ Resistencia {k+1}, Opinión {i+1}: se mueven {movidas} pero solo hay {disp} disponibles"
+            for k, i, movidas, disp in zip(ks.tolist(), opiniones.tolist(),
+                                           movimientos_desde[ks, opiniones].tolist(),
+                                           disponibles[ks, opiniones].tolist())
+        )
+        valido = False
     
     if valido:
         result.append("  ✅ Todas las restricciones de conservación se cumplen")
@@ -55,30 +111,25 @@ def verificar_solucion(x: List[List[List[int]]], p: List[int], s: List[List[int]
     
     # ===== RESTRICCIÓN 2: No auto-movimientos =====
     result.append("📋 Restricción 2: No auto-movimientos")
-    auto_movs = False
-    for k in range(3):
-        for i in range(m):
-            if x_arrays[k][i][i] > 0:
-                result.append(f"  ❌ Resistencia {k+1}, Opinión {i+1}: hay {x_arrays[k][i][i]} auto-movimientos")
-                valido = False
-                auto_movs = True
-    
-    if not auto_movs:
+    diagonales = np.einsum('kii->ki', X)
+    ks, opiniones = np.nonzero(diagonales > 0)
+    if len(ks):
+        result.extend(
+            f"  ❌ Resistencia {k+1}, Opinión {i+1}: hay {cantidad} auto-movimientos"
+            for k, i, cantidad in zip(ks.tolist(), opiniones.tolist(),
+                                      diagonales[ks, opiniones].tolist())
+        )
+        valido = False
+    else:
         result.append("  ✅ No hay auto-movimientos")
     result.append("")
     
     # ===== RESTRICCIÓN 3: Distribución final =====
     result.append("📋 Restricción 3: Distribución final")
     
-    # Calcular salidas y llegadas para cada opinión
-    q_final = []
-    for i in range(m):
-        salidas = sum(x_arrays[k][i].sum() for k in range(3))
-        llegadas = sum(x_arrays[k][:, i].sum() for k in range(3))
-        q_i = p[i] - salidas + llegadas
-        q_final.append(int(q_i))
+    q_final = q_array.tolist()
     
-    result.append(f"  Distribución inicial: {p}")
+    result.append(f"  Distribución inicial: {p_array.tolist()}")
     result.append(f"  Distribución final:   {q_final}")
     
     total_final = sum(q_final)
@@ -92,14 +143,6 @@ def verificar_solucion(x: List[List[List[int]]], p: List[int], s: List[List[int]
     # ===== RESTRICCIÓN 4: Límite de costo total =====
     result.append("📋 Restricción 4: Límite de costo total")
     
-    costo_total = 0.0
-    for k in range(3):
-        for i in range(m):
-            for j in range(m):
-                if i != j and x_arrays[k][i][j] > 0:
-                    costo_movimiento = x_arrays[k][i][j] * abs(i - j) * resistencia[k]
-                    costo_total += costo_movimiento
-    
     result.append(f"  Costo total usado: {costo_total:.2f}")
     result.append(f"  Costo máximo permitido: {ct_max:.2f}")
     
@@ -113,13 +156,6 @@ def verificar_solucion(x: List[List[List[int]]], p: List[int], s: List[List[int]
     # ===== RESTRICCIÓN 5: Límite de movimientos =====
     result.append("📋 Restricción 5: Límite de movimientos")
     
-    movimientos_totales = 0
-    for k in range(3):
-        for i in range(m):
-            for j in range(m):
-                if i != j:
-                    movimientos_totales += x_arrays[k][i][j] * abs(i - j)
-    
     result.append(f"  Movimientos usados: {movimientos_totales}")
     result.append(f"  Movimientos máximos: {int(maxMovs)}")
     
@@ -133,54 +169,46 @@ def verificar_solucion(x: List[List[List[int]]], p: List[int], s: List[List[int]
     # ===== CÁLCULO DE POLARIZACIÓN =====
     result.append("📊 Cálculo de Polarización")
     
-    # Calcular mediana ponderada
-    q_array = np.array(q_final)
-    pos_mediana = (n + 1) // 2
-    acum = 0
-    mediana = v_array[0]
-    
-    for i in range(m):
-        acum += q_final[i]
-        if acum >= pos_mediana:
-            mediana = v_array[i]
-            break
-    
     result.append(f"  Mediana ponderada: {mediana:.3f}")
-    
-    # Calcular polarización
-    polarizacion = sum(q_final[i] * abs(v_array[i] - mediana) for i in range(m))
-    
     result.append(f"  Polarización calculada: {polarizacion:.6f}")
     result.append("")
     
     # ===== RESUMEN FINAL =====
-    result.append("=" * 60)
+    result.append(_BANNER)
     if valido:
         result.append("🎉 RESULTADO: SOLUCIÓN VÁLIDA")
         result.append("   Todas las restricciones se cumplen correctamente")
     else:
         result.append("❌ RESULTADO: SOLUCIÓN INVÁLIDA")
         result.append("   Una o más restricciones fueron violadas")
-    result.append("=" * 60)
+    result.append(_BANNER)
     
     # ===== DETALLE DE MOVIMIENTOS =====
     result.append("")
     result.append("📝 Detalle de movimientos por resistencia:")
     result.append("")
     
+    # Solo se recorren las celdas con movimientos: argwhere las devuelve ordenadas por
+    # (k, i, j), igual que los tres bucles anidados, y X[hay] en el mismo orden
+    hay = X > 0
+    coords = np.argwhere(hay)[:, 1:].tolist()
+    cantidades = X[hay].tolist()
+    fin_por_k = np.cumsum(hay.sum(axis=(1, 2))).tolist()
+    inicio = 0
+    
     for k in range(3):
         nivel = ["Baja", "Media", "Alta"][k]
         result.append(f"  Resistencia {nivel} (k={k+1}):")
         
-        hay_movimientos = False
-        for i in range(m):
-            for j in range(m):
-                if x_arrays[k][i][j] > 0:
-                    hay_movimientos = True
-                    result.append(f"    • {x_arrays[k][i][j]} persona(s) de opinión {i+1} → opinión {j+1}")
-        
-        if not hay_movimientos:
+        fin = fin_por_k[k]
+        if fin > inicio:
+            result.extend(
+                f"    • {cantidad} persona(s) de opinión {i+1} → opinión {j+1}"
+                for (i, j), cantidad in zip(coords[inicio:fin], cantidades[inicio:fin])
+            )
+        else:
             result.append(f"    (Sin movimientos)")
+        inicio = fin
         result.append("")
     
     return "\n".join(result)
\ No newline at end of file
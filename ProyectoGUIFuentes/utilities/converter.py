@@ -0,0 +1,153 @@
+import os
+import re
+import glob
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Este módulo no depende de PyQt6: la conversión TXT → DZN se puede usar desde
+# scripts sin cargar la interfaz gráfica.
+
+# Directorios ya creados en esta sesión (evita repetir os.makedirs)
+_directorios_creados = set()
+
+# Separador de los arreglos p y v: normaliza "a,b" y "a, b" a "a, b" en una sola pasada
+# (sobre bytes, sin decodificar la entrada)
+_SEPARADOR_RE = re.compile(rb',\s*')
+
+
+def asegurar_directorio(directorio: str) -> None:
+    """Crea `directorio` si no existe, una sola vez por sesión."""
+    if directorio not in _directorios_creados:
+        os.makedirs(directorio, exist_ok=True)
+        _directorios_creados.add(directorio)
+
+
+def en_directorio(directorio: str, operacion, *args):
+    """
+    Asegura `directorio` y ejecuta `operacion(*args)`, que escribe dentro de él.
+
+    La caché de asegurar_directorio no vuelve a revisar el disco: si el directorio
+    se borró durante la sesión, la operación falla con FileNotFoundError; en ese caso
+    se vuelve a crear y se reintenta una vez. Si el directorio existe, el archivo que
+    falta es otro (p. ej. el TXT de entrada) y el error se propaga sin reintentar.
+    """
+    asegurar_directorio(directorio)
+    try:
+        return operacion(*args)
+    except FileNotFoundError:
+        if os.path.isdir(directorio):
+            raise
+        _directorios_creados.discard(directorio)
+        asegurar_directorio(directorio)
+        return operacion(*args)
+
+
+@functools.lru_cache(maxsize=32)
+def _construir_dzn(txt_file_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Convierte el contenido de un archivo TXT de entrada al formato DZN (en bytes).
+
+    `mtime_ns` y `size` no se usan en el cuerpo: forman parte de la clave de la
+    caché para que un archivo modificado se vuelva a convertir.
+    """
+    # Los archivos de entrada son ASCII (dígitos, puntos y comas): se procesan en
+    # binario de principio a fin, sin decodificar ni volver a codificar. El archivo
+    # se recorre línea a línea sin cargarlo completo en memoria.
+    with open(txt_file_path, 'rb', buffering=1 << 16) as txt_file:
+        # Cada línea se limpia una sola vez y se descartan las vacías; los campos se
+        # consumen en orden desde el iterador, sin materializar una lista de líneas
+        lines = filter(None, map(bytes.strip, txt_file))
+
+        try:
+            n = next(lines)
+            m = int(next(lines))
+            p_raw = next(lines)
+            v_raw = next(lines)
+        except StopIteration:
+            raise ValueError("El archivo no tiene el formato esperado (mínimo 7 líneas).") from None
+
+        # La matriz s ocupa las m líneas siguientes; después vienen ct y maxMovs
+        try:
+            matrix_lines = [next(lines) for _ in range(m)]
+            ct = next(lines)
+            maxMovs = next(lines)
+        except StopIteration:
+            raise ValueError(f"El valor de 'm' ({m}) no coincide con la cantidad de filas esperadas.") from None
+
+    p = b'[' + _SEPARADOR_RE.sub(b', ', p_raw) + b']'
+    v = b'[' + _SEPARADOR_RE.sub(b', ', v_raw) + b']'
+    s = b"[| " + b' |\n        '.join(matrix_lines) + b" |]"
+
+    # Construir todo el contenido DZN para escribirlo de una sola vez
+    return (
+        b"n = %s;\nm = %d;\n\np = %s;\n\nv = %s;\n\n"
+        b"s = %s;\n\nct = %s;\n\nmaxMovs = %s;"
+    ) % (n, m, p, v, s, ct, maxMovs)
+
+
+def convertir_txt_a_dzn(txt_file_path: str, dzn_file_path: str) -> None:
+    """
+    Convierte un archivo TXT de entrada de MinPol a un archivo DZN para MiniZinc.
+
+    Lanza ValueError si el TXT no tiene el formato esperado.
+    """
+    # Reutilizar la conversión si el TXT no cambió desde la última vez
+    txt_stat = os.stat(txt_file_path)
+    dzn_bytes = _construir_dzn(txt_file_path, txt_stat.st_mtime_ns, txt_stat.st_size)
+
+    # Omitir la escritura si el DZN destino ya tiene exactamente este contenido
+    try:
+        dzn_actualizado = (os.path.getsize(dzn_file_path) == len(dzn_bytes)
+                           and Path(dzn_file_path).read_bytes() == dzn_bytes)
+    except OSError:
+        dzn_actualizado = False
+
+    if not dzn_actualizado:
+        # Los DZN pesan pocos KB: normalmente una sola llamada a os.write, sin la pila
+        # de E/S de Python (O_BINARY evita la traducción de saltos de línea en Windows)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(dzn_file_path, flags, 0o644)
+        try:
+            pendiente = memoryview(dzn_bytes)
+            while pendiente:
+                pendiente = pendiente[os.write(fd, pendiente):]
+        finally:
+            os.close(fd)
+
+
+def _convertir_a_directorio(txt_file_path: str, directorio_salida: str) -> Tuple[str, Optional[str]]:
+    """Convierte un TXT a <nombre>.dzn en `directorio_salida` y devuelve (ruta_txt, error)."""
+    dzn_file_path = str(Path(directorio_salida) / f"{Path(txt_file_path).stem}.dzn")
+    try:
+        convertir_txt_a_dzn(txt_file_path, dzn_file_path)
+        return txt_file_path, None
+    except Exception as e:
+        return txt_file_path, str(e)
+
+
+def convertir_lote(directorio: str, directorio_salida: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+    """
+    Convierte todos los archivos .txt de `directorio` a DZN.
+
+    Cada archivo se escribe como <nombre>.dzn en `directorio_salida` (por defecto,
+    el mismo directorio de entrada). Las conversiones se reparten entre procesos.
+
+    Returns:
+        Lista de (ruta_txt, error) por archivo; error es None si la conversión fue exitosa
+    
+    Lanza NotADirectoryError si `directorio` no es un directorio existente.
+    """
+    if not os.path.isdir(directorio):
+        raise NotADirectoryError(f"No es un directorio: {directorio}")
+    directorio_salida = directorio_salida or directorio
+    # Una vez por lote: se revisa el disco aunque la caché diga que ya existe
+    _directorios_creados.discard(directorio_salida)
+    asegurar_directorio(directorio_salida)
+    txt_files = sorted(glob.iglob(os.path.join(directorio, "*.txt")))
+
+    # Cada archivo es independiente: el parseo y formateo se reparte entre núcleos
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_convertir_a_directorio, txt_files, repeat(directorio_salida)))
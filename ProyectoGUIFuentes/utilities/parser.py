@@ -2,105 +2,141 @@ import re
 import numpy as np
 from typing import Tuple, List
 
-import re
-from typing import Tuple, List
+# Encabezados de las matrices de movimientos (en minúsculas) -> índice k-1
+MAT_HEADERS = {
+    "=== matriz de movimientos (resistencia baja, k=1) ===": 0,
+    "=== matriz de movimientos (resistencia media, k=2) ===": 1,
+    "=== matriz de movimientos (resistencia alta, k=3) ===": 2,
+}
+
+# Líneas que cierran el bloque de distribución final
+_FIN_DISTRIBUCION = ("mediana:", "costo total", "movimientos totales")
+
+# Valor numérico de la polarización y formato alternativo 'polarizacion = X.X;'
+_POL_NUMERO = re.compile(r"[0-9]+\.[0-9]+|[0-9]+")
+_POL_VAR = re.compile(r"polarizacion\s*=\s*([0-9]+\.[0-9]+|[0-9]+)\s*;", re.IGNORECASE)
 
-def parse_minizinc_output(output_text: str) -> Tuple[str, List[int], List[List[List[int]]]]:
+# Valor devuelto como polarización cuando la salida no contiene ninguna
+POL_NO_ENCONTRADA = "Valor no encontrado"
+
+
+def parse_minizinc_output(output_text: str) -> Tuple[str, List[int], np.ndarray]:
     """
     Parsea la salida de MiniZinc para el problema MinPol.
     
+    La salida se recorre una sola vez, línea por línea, con una pequeña máquina de
+    estados (distribución final / matriz k); de cada sección se toma la primera
+    aparición.
+    
     Returns:
         - polarizacion (str): Valor de la polarización final
         - q_final (List[int]): Distribución final de personas por opinión
-        - x_matrices (List[List[List[int]]]): 3 matrices de movimientos [k][i][j] para k=1,2,3
+        - x_matrices (np.ndarray): arreglo int64 de forma (3, m, m) con las matrices de
+          movimientos [k][i][j] para k=1,2,3 (filas o matrices faltantes quedan en cero)
     """
-    
-    # NOTA: La zona de búsqueda ya no se usa para polarización/q_final porque estos
-    # valores se imprimen antes del separador final de MiniZinc (==========).
-    
-    # 1. Delimitar la zona de búsqueda (solo útil si el output tiene múltiples soluciones)
-    last_solution_start = output_text.rfind("----------")
-    if last_solution_start == -1:
-        last_solution_start = output_text.rfind("==========")
-    
-    if last_solution_start != -1:
-        # Usamos solo el texto después del último separador de solución como fallback
-        search_area = output_text[last_solution_start:]
-    else:
-        search_area = output_text # Si no hay separador, usar todo el output
-
-    # --- 2. EXTRAER POLARIZACIÓN FINAL (Busca en todo el output_text) ---
-    polarizacion = "Valor no encontrado"
-    
-    # 1. Patrón para el formato de etiqueta: 'Polarizacion final: X.X'
-    pol_match = re.search(r"Polarizacion\s+final:\s*([0-9]+\.[0-9]+|[0-9]+)\s*", output_text, re.IGNORECASE)
-    
-    # 2. Fallback para formato de variable MiniZinc: 'polarizacion = X.X;'
-    if not pol_match:
-        pol_match = re.search(r"polarizacion\s*=\s*([0-9]+\.[0-9]+|[0-9]+)\s*;", output_text, re.IGNORECASE)
-    
-    if pol_match:
-        # Captura el valor y limpia el ';' final si existe
-        polarizacion = pol_match.group(1).strip().rstrip(';')
-
-    # --- 3. EXTRAER DISTRIBUCIÓN FINAL (Busca en todo el output_text) ---
+    polarizacion = None
     q_final = []
+    x_matrices = [[], [], []]
     
-    # 1. Patrón para el bloque de texto: 'Distribucion final...' hasta 'Mediana:', 'Costo total', o 'Movimientos'
-    dist_block_match = re.search(
-        r"Distribucion\s+final\s+de\s+personas\s+por\s+opinion:\s*\n(.+?)(?:Mediana:|Costo total|Movimientos totales)", 
-        output_text, 
-        re.DOTALL | re.IGNORECASE
-    )
+    dist_encontrada = False
+    dist_actual = None          # Opiniones del bloque de distribución en curso
+    matriz_actual = None        # Índice de la matriz en curso
+    matriz_iniciada = False     # Ya se leyó alguna línea no vacía de la matriz en curso
+    matrices_vistas = set()
     
-    if dist_block_match:
-        dist_text = dist_block_match.group(1)
-        # Buscar líneas con formato "Opinion X: Y personas"
-        opinion_matches = re.findall(r"Opinion\s+\d+:\s*(\d+)\s+personas", dist_text, re.IGNORECASE)
-        try:
-            # Convertir a lista de enteros. Esto producirá [0, 10, 0] para tu ejemplo.
-            q_final = [int(x) for x in opinion_matches]
-        except ValueError:
-            q_final = ["Error de parsing en bloque etiquetado"]
-
-    # --- 4. EXTRAER MATRICES DE MOVIMIENTOS (Busca en todo el output_text, como debe ser) ---
-    x_matrices = []
-    
-    for k in range(1, 4):  # k = 1, 2, 3
-        # Patrones que buscan las etiquetas '=== MATRIZ DE MOVIMIENTOS...'
-        if k == 1:
-            pattern = r"=== MATRIZ DE MOVIMIENTOS \(Resistencia Baja, k=1\) ===\s*\n(.+?)(?:\n\n|=== MATRIZ DE MOVIMIENTOS \(Resistencia Media, k=2\)|===|\Z)"
-        elif k == 2:
-            pattern = r"=== MATRIZ DE MOVIMIENTOS \(Resistencia Media, k=2\) ===\s*\n(.+?)(?:\n\n|=== MATRIZ DE MOVIMIENTOS \(Resistencia Alta, k=3\)|===|\Z)"
-        else:
-            pattern = r"=== MATRIZ DE MOVIMIENTOS \(Resistencia Alta, k=3\) ===\s*\n(.+?)(?:\n\n|===|\Z)"
+    for raw_line in output_text.splitlines():
+        line = raw_line.strip()
+        low = line.lower()
         
-        matriz_match = re.search(pattern, output_text, re.DOTALL | re.IGNORECASE)
+        # Cada sección se detecta de forma independiente: una misma línea puede
+        # cerrar una sección y ser relevante para otra
         
-        if matriz_match:
-            matriz_str = matriz_match.group(1).strip()
-            filas = [f.strip() for f in matriz_str.split('\n') if f.strip()]
-            
-            matriz_k = []
-            for fila in filas:
-                # Quitar corchetes/espacios/etc. y SEPARAR POR COMAS o ESPACIOS MÚLTIPLES
-                clean_fila = re.sub(r'[\[\]]', '', fila)
-                elementos = [e.strip() for e in re.split(r',\s*|\s+', clean_fila) if e.strip()]
-                
+        # --- Polarización: 'Polarizacion final: X.X' ---
+        if polarizacion is None and low.startswith("polarizacion"):
+            etiqueta, _, valor = line.partition(':')
+            if etiqueta.lower().split() == ["polarizacion", "final"]:
+                numero = _POL_NUMERO.match(valor.strip())
+                if numero:
+                    polarizacion = numero.group(0)
+        
+        # --- Distribución final: líneas 'Opinion X: Y personas' hasta 'Mediana:',
+        # 'Costo total' o 'Movimientos totales' ---
+        if dist_actual is not None:
+            if any(fin in low for fin in _FIN_DISTRIBUCION):
+                q_final = dist_actual
+                dist_actual = None
+                dist_encontrada = True
+            elif low.startswith("opinion"):
+                etiqueta, _, resto = line.partition(':')
+                partes = resto.split()
+                if (len(etiqueta.split()) == 2 and etiqueta.split()[1].isdigit()
+                        and len(partes) >= 2 and partes[0].isdigit() and partes[1].lower() == "personas"):
+                    dist_actual.append(int(partes[0]))
+        elif not dist_encontrada and low.split() == ["distribucion", "final", "de", "personas", "por", "opinion:"]:
+            dist_actual = []
+        
+        # --- Matriz de movimientos en curso: filas hasta una línea vacía o un '===' ---
+        if matriz_actual is not None:
+            if not line:
+                # Las líneas vacías justo después del encabezado se ignoran
+                if matriz_iniciada:
+                    matriz_actual = None
+            elif '===' in line:
+                matriz_actual = None
+            else:
+                matriz_iniciada = True
+                # Quitar corchetes y separar por comas o espacios
+                elementos = line.replace('[', '').replace(']', '').replace(',', ' ').split()
                 try:
-                    matriz_k.append([int(e) for e in elementos])
+                    x_matrices[matriz_actual].append([int(e) for e in elementos])
                 except ValueError:
-                    continue
-            
-            x_matrices.append(matriz_k)
-        else:
-            x_matrices.append([])
+                    pass
+        
+        if matriz_actual is None:
+            if low in MAT_HEADERS and MAT_HEADERS[low] not in matrices_vistas:
+                matriz_actual = MAT_HEADERS[low]
+                matriz_iniciada = False
+                matrices_vistas.add(matriz_actual)
+            elif polarizacion is not None and dist_encontrada and len(matrices_vistas) == 3:
+                # Ya se tiene todo: el resto de la salida (otras soluciones) no se recorre
+                break
+    
+    # Fallback para formato de variable MiniZinc: 'polarizacion = X.X;'
+    if polarizacion is None:
+        pol_match = _POL_VAR.search(output_text)
+        polarizacion = pol_match.group(1) if pol_match else POL_NO_ENCONTRADA
+    
+    # Las tres matrices se materializan una sola vez en un arreglo contiguo (3, m, m)
+    m_inferido = max((len(fila) for matriz in x_matrices for fila in matriz), default=0)
+    m_inferido = max(m_inferido, max(len(matriz) for matriz in x_matrices))
+    X = np.zeros((3, m_inferido, m_inferido), dtype=np.int64)
+    for k, matriz in enumerate(x_matrices):
+        for i, fila in enumerate(matriz):
+            X[k, i, :len(fila)] = fila
     
-    return polarizacion, q_final, x_matrices
+    return polarizacion, q_final, X
+
+
+def _arreglo_dzn(campo: str, texto: str, dtype) -> np.ndarray:
+    """
+    Convierte los valores separados por comas de `texto` con np.fromstring.
+
+    En NumPy 1.x fromstring se detiene sin error en el primer valor inválido y
+    devuelve un arreglo más corto: se compara con la cantidad de valores del texto.
+    """
+    texto = texto.strip()
+    esperados = texto.count(',') + 1 if texto else 0
+    try:
+        valores = np.fromstring(texto, dtype=dtype, sep=',')
+    except ValueError:
+        valores = None
+    if valores is None or valores.size != esperados:
+        raise ValueError(f"El campo '{campo}' del DZN contiene valores no válidos")
+    return valores
 
 
 def parse_dzn_input(dzn_path: str) -> dict:
-    # Esta función no se modificó ya que el parsing de DZN estaba correcto.
+    # Los arreglos p, v y s se devuelven como np.ndarray (int64, float64 e int64 (m, 3))
     params = {}
     
     try:
@@ -125,10 +161,10 @@ def parse_dzn_input(dzn_path: str) -> dict:
                 params['m'] = int(value)
             elif key == 'p':
                 # Array de enteros: [3, 3, 4]
-                params['p'] = [int(x.strip()) for x in value.strip('[]').split(',')]
+                params['p'] = _arreglo_dzn('p', value.strip('[]'), np.int64)
             elif key == 'v':
                 # Array de floats: [0.297, 0.673, 0.809]
-                params['v'] = [float(x.strip()) for x in value.strip('[]').split(',')]
+                params['v'] = _arreglo_dzn('v', value.strip('[]'), np.float64)
             elif key == 's':
                 # Matriz 2D: [| 1,2,0 | 0,3,0 | 2,1,1 |]
                 # Extraer contenido entre [| y |]
@@ -138,15 +174,25 @@ def parse_dzn_input(dzn_path: str) -> dict:
                     matrix_content = value[start+2:end]
                     filas = [f.strip() for f in matrix_content.split('|') if f.strip()]
                     
-                    s_matrix = []
-                    for fila in filas:
-                        elementos = [int(x.strip()) for x in fila.split(',') if x.strip()]
-                        s_matrix.append(elementos)
+                    # Cada fila tiene una columna por nivel de resistencia
+                    if any(fila.count(',') != 2 for fila in filas):
+                        raise ValueError("El campo 's' del DZN debe tener 3 valores por fila")
                     
-                    params['s'] = s_matrix
+                    # Todas las filas se leen de una vez y se reordenan en (filas, 3)
+                    valores = _arreglo_dzn('s', ','.join(filas), np.int64)
+                    params['s'] = valores.reshape(len(filas), 3)
             elif key == 'ct':
                 params['ct'] = float(value)
             elif key == 'maxMovs':
                 params['maxMovs'] = float(value)
     
+    # Los arreglos deben corresponder a las m opiniones
+    m = params.get('m')
+    if m is not None:
+        for campo in ('p', 'v'):
+            if campo in params and len(params[campo]) != m:
+                raise ValueError(f"El campo '{campo}' del DZN tiene {len(params[campo])} valores; se esperaban m = {m}")
+        if 's' in params and params['s'].shape != (m, 3):
+            raise ValueError(f"El campo 's' del DZN tiene {params['s'].shape[0]} filas; se esperaban m = {m}")
+    
     return params
\ No newline at end of file